@@ -40,17 +40,31 @@ example code:
         app.exec_()
 """
 
+import os
+
 from .pkg_info import __version__ as VERSION
 from .pkg_info import __license__ as LICENSE
 
+# NOTE: the sub packages import each other, "base" has to be imported first
+# so importing any sub package directly resolves the circular imports.
 from NodeGraphQt import base  # noqa
 from NodeGraphQt import nodes  # noqa
 from NodeGraphQt import qgraphics  # noqa
 from NodeGraphQt import widgets  # noqa
 
+# install the icecream "ic()" debug helper only when debugging is requested.
+if os.environ.get("NODEGRAPHQT_DEBUG"):
+    from icecream import install
 
-from icecream import install
-
-install()
+    install()
 
 __version__ = VERSION
+
+__all__ = [
+    "VERSION",
+    "LICENSE",
+    "base",
+    "nodes",
+    "qgraphics",
+    "widgets",
+]
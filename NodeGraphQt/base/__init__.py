@@ -3,8 +3,11 @@ from NodeGraphQt.base.commands import (
     NodeVisibleCmd,
     NodeWidgetVisibleCmd,
     NodeMovedCmd,
+    NodesMovedCmd,
+    NodesDisabledCmd,
     NodeAddedCmd,
     NodesRemovedCmd,
+    NodesBulkRemovedCmd,
     NodeInputConnectedCmd,
     NodeInputDisconnectedCmd,
     PortConnectedCmd,
@@ -31,8 +34,11 @@ __all__ = [
     "NodeVisibleCmd",
     "NodeWidgetVisibleCmd",
     "NodeMovedCmd",
+    "NodesMovedCmd",
+    "NodesDisabledCmd",
     "NodeAddedCmd",
     "NodesRemovedCmd",
+    "NodesBulkRemovedCmd",
     "NodeInputConnectedCmd",
     "NodeInputDisconnectedCmd",
     "PortConnectedCmd",
@@ -1,6 +1,78 @@
-from PySide6 import QtGui
+from contextlib import contextmanager
+
+from PySide6 import QtGui, QtWidgets
 
 from NodeGraphQt.constants import PortTypeEnum
+from NodeGraphQt.errors import PortError
+
+_IN = PortTypeEnum.IN.value
+_OUT = PortTypeEnum.OUT.value
+
+
+# suspend the scene index only when a batch is at least this fraction of the
+# scene nodes, re-indexing the whole scene costs more for smaller batches.
+_SUSPEND_INDEX_FRACTION = 0.25
+
+
+@contextmanager
+def _suspended_scene_index(scene, item_count, scene_item_count):
+    """
+    Disable the scene item indexing while adding or removing a large batch
+    of items so the index is only rebuilt once when the batch is done.
+
+    Args:
+        scene (QtWidgets.QGraphicsScene): node scene.
+        item_count (int): number of nodes in the batch.
+        scene_item_count (int): number of nodes in the scene including the
+            batch.
+    """
+    no_index = QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex
+    index_method = scene.itemIndexMethod()
+    # switching the index method back rebuilds the index over the entire
+    # scene, small batches are cheaper to update item by item.
+    if (
+        item_count < 2
+        or item_count < scene_item_count * _SUSPEND_INDEX_FRACTION
+        or index_method == no_index
+    ):
+        yield
+        return
+
+    scene.setItemIndexMethod(no_index)
+    try:
+        yield
+    finally:
+        scene.setItemIndexMethod(index_method)
+
+
+def _update_connected_pipes(node_view):
+    """
+    Redraw the connected pipes of a node item.
+
+    The pipes are drawn with a device coordinate cache that a scene update
+    doesn't invalidate, so each pipe item is updated.
+
+    Args:
+        node_view (NodeGraphQt.NodeItem): node item.
+    """
+    for port in node_view.inputs + node_view.outputs:
+        for pipe in port.connected_pipes:
+            pipe.update()
+
+
+def _in_out_ports(src_port, trg_port):
+    """
+    Order a pair of connected ports as (input port, output port).
+
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+
+    Returns:
+        tuple(NodeGraphQt.Port, NodeGraphQt.Port): input port, output port.
+    """
+    pair = (src_port, trg_port)
+    return pair if src_port.dtype == _IN else pair[::-1]
 
 
 class PropertyChangedCmd(QtGui.QUndoCommand):
@@ -13,6 +85,9 @@ class PropertyChangedCmd(QtGui.QUndoCommand):
         value (object): node property value.
     """
 
+    #: properties where consecutive changes are merged into a single command.
+    MERGEABLE_PROPERTIES = frozenset({"border_color", "text_color"})
+
     def __init__(self, node, name, value):
         super().__init__()
         # TODO: node.name() -> node.view.name
@@ -30,27 +105,31 @@ class PropertyChangedCmd(QtGui.QUndoCommand):
         model = self.node.model
         model.set_property(name, value)
 
-        # set view data.
-        view = self.node.view
-
-        # view widgets.
-        if hasattr(view, "widgets") and name in view.widgets.keys():
-            # check if previous value is identical to current value,
-            # prevent signals from causing an infinite loop.
-            if view.widgets[name].get_value() is not value:
-                view.widgets[name].set_value(value)
+        # set view data. (view properties or embedded widgets)
+        old_name = self.node.view.name
+        setter = self.node.view.get_property_setter(name)
+        if setter:
+            setter(value)
 
-        # view properties.
-        if name in view.properties.keys():
-            # remap "pos" to "xy_pos" node view has pre-existing pos method.
-            if name == "pos":
-                name = "xy_pos"
-            setattr(view, name, value)
+        graph = self.node.graph
+        if name == "name":
+            graph.model.rename_node(self.node, old_name, self.node.view.name)
 
         # emit property changed signal.
-        graph = self.node.graph
         graph.property_changed.emit(self.node, self.name, value)
 
+    def id(self):
+        if self.name not in self.MERGEABLE_PROPERTIES:
+            return -1
+        # Qt expects a positive command id.
+        return hash((id(self.node), self.name)) & 0x7FFFFFFF
+
+    def mergeWith(self, other):
+        if other.node is not self.node or other.name != self.name:
+            return False
+        self.new_val = other.new_val
+        return True
+
     def undo(self):
         if self.old_val is not self.new_val:
             self.set_node_property(self.name, self.old_val)
@@ -83,10 +162,7 @@ class NodeVisibleCmd(QtGui.QUndoCommand):
         node_view.visible = visible
 
         # redraw the connected pipes in the scene.
-        ports = node_view.inputs + node_view.outputs
-        for port in ports:
-            for pipe in port.connected_pipes:
-                pipe.update()
+        _update_connected_pipes(node_view)
 
         # restore the node selected state.
         if self.selected != node_view.isSelected():
@@ -147,6 +223,8 @@ class NodeMovedCmd(QtGui.QUndoCommand):
         self.prev_pos = prev_pos
 
     def undo(self):
+        if self.pos == self.prev_pos:
+            return
         self.node.view.xy_pos = self.prev_pos
         self.node.model.pos = self.prev_pos
 
@@ -157,6 +235,61 @@ class NodeMovedCmd(QtGui.QUndoCommand):
         self.node.model.pos = self.pos
 
 
+class NodesMovedCmd(QtGui.QUndoCommand):
+    """
+    Multiple nodes moved command.
+
+    Args:
+        moves (list[tuple]): list of
+            (node, new position, previous position) tuples.
+    """
+
+    def __init__(self, moves):
+        super().__init__()
+        self.setText("move nodes")
+        # positions can be tuples or lists, compare the coordinates.
+        self.moves = [m for m in moves if list(m[1]) != list(m[2])]
+
+    def undo(self):
+        for node, _, prev_pos in self.moves:
+            node.view.xy_pos = prev_pos
+            node.model.pos = prev_pos
+
+    def redo(self):
+        for node, pos, _ in self.moves:
+            node.view.xy_pos = pos
+            node.model.pos = pos
+
+
+class NodesDisabledCmd(QtGui.QUndoCommand):
+    """
+    Multiple nodes disabled state changed command.
+
+    Args:
+        changes (list[tuple]): list of
+            (node, disabled state, previous disabled state) tuples.
+    """
+
+    def __init__(self, changes):
+        super().__init__()
+        self.setText("disable nodes")
+        self.changes = [c for c in changes if c[1] != c[2]]
+
+    @staticmethod
+    def set_node_disabled(node, state):
+        # go through the node setter so the connected pipes are redrawn and
+        # node subclass overrides are called.
+        node.set_property("disabled", state, push_undo=False)
+
+    def undo(self):
+        for node, _, prev_state in self.changes:
+            self.set_node_disabled(node, prev_state)
+
+    def redo(self):
+        for node, state, _ in self.changes:
+            self.set_node_disabled(node, state)
+
+
 class NodeAddedCmd(QtGui.QUndoCommand):
     """
     Node added command.
@@ -178,17 +311,20 @@ class NodeAddedCmd(QtGui.QUndoCommand):
 
     def undo(self):
         node_id = self.node.id
-        # TODO: n.x_pos(), n.y_pos() -> n.view.xy_pos
-        self.pos = self.pos or self.node.view.xy_pos
-        self.graph.model.nodes.pop(self.node.id)
+        self.graph.model.remove_node(node_id)
         self.node.view.delete()
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit([node_id])
 
     def redo(self):
-        self.graph.model.nodes[self.node.id] = self.node
+        self.graph.model.add_node(self.node)
         self.graph.viewer().add_node(self.node.view, self.pos)
+        if self.pos is None:
+            # snapshot where the viewer placed the node so a redo after an
+            # undo adds it back to the same position.
+            # TODO: n.x_pos(), n.y_pos() -> n.view.xy_pos
+            self.pos = self.node.view.xy_pos
 
         # node width & height is calculated when it's added to the scene,
         # so we have to update the node model here.
@@ -217,54 +353,90 @@ class NodesRemovedCmd(QtGui.QUndoCommand):
         self.emit_signal = emit_signal
 
     def undo(self):
+        scene = self.graph.scene()
+        model = self.graph.model
+        node_count = len(self.nodes)
+        scene_node_count = len(model.nodes) + node_count
+        with _suspended_scene_index(scene, node_count, scene_node_count):
+            for node in self.nodes:
+                scene.addItem(node.view)
         for node in self.nodes:
-            self.graph.model.nodes[node.id] = node
-            self.graph.scene().addItem(node.view)
+            model.add_node(node)
 
-            if self.emit_signal:
+        if self.emit_signal:
+            for node in self.nodes:
                 self.graph.node_created.emit(node)
 
     def redo(self):
-        node_ids = []
-        for node in self.nodes:
-            node_ids.append(node.id)
-            self.graph.model.nodes.pop(node.id)
-            node.view.delete()
+        node_ids = [node.id for node in self.nodes]
+        model = self.graph.model
+        for node_id in node_ids:
+            model.remove_node(node_id)
+
+        node_count = len(self.nodes)
+        scene_node_count = len(model.nodes) + node_count
+        with _suspended_scene_index(self.graph.scene(), node_count, scene_node_count):
+            for node in self.nodes:
+                node.view.delete()
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit(node_ids)
 
 
-class NodeInputConnectedCmd(QtGui.QUndoCommand):
+def _connect_ports(src, trg, emit_signal):
     """
-    "BaseNode.on_input_connected()" command.
+    Connect two ports in the port models and views.
 
     Args:
-        src_port (NodeGraphQt.Port): source port.
-        trg_port (NodeGraphQt.Port): target port.
+        src (NodeGraphQt.Port): source port.
+        trg (NodeGraphQt.Port): target port.
+        emit_signal (bool): emit the "port_connected" signal.
     """
+    src_node, trg_node = src.node, trg.node
 
-    def __init__(self, src_port, trg_port):
-        super().__init__()
-        if src_port.dtype == PortTypeEnum.IN.value:
-            self.source = src_port
-            self.target = trg_port
-        else:
-            self.source = trg_port
-            self.target = src_port
+    src.model.connected_ports[trg_node.id][trg.name] = None
+    trg.model.connected_ports[src_node.id][src.name] = None
 
-    def undo(self):
-        node = self.source.node
-        node.on_input_disconnected(self.source, self.target)
+    src.view.connect_to(trg.view)
 
-    def redo(self):
-        node = self.source.node
-        node.on_input_connected(self.source, self.target)
+    # emit "port_connected" signal from the parent graph.
+    if emit_signal:
+        src_node.graph.port_connected.emit(*_in_out_ports(src, trg))
 
 
-class NodeInputDisconnectedCmd(QtGui.QUndoCommand):
+def _disconnect_ports(src, trg, emit_signal):
     """
-    Node "on_input_disconnected()" command.
+    Disconnect two ports in the port models and views.
+
+    Args:
+        src (NodeGraphQt.Port): source port.
+        trg (NodeGraphQt.Port): target port.
+        emit_signal (bool): emit the "port_disconnected" signal.
+    """
+    src_node, trg_node = src.node, trg.node
+
+    for model, node_id, port_name in (
+        (src.model, trg_node.id, trg.name),
+        (trg.model, src_node.id, src.name),
+    ):
+        connected_ports = model.connected_ports
+        port_names = connected_ports.get(node_id)
+        if port_names is not None:
+            port_names.pop(port_name, None)
+            if not port_names:
+                del connected_ports[node_id]
+
+    src.view.disconnect_from(trg.view)
+
+    # emit "port_disconnected" signal from the parent graph.
+    if emit_signal:
+        src_node.graph.port_disconnected.emit(*_in_out_ports(src, trg))
+
+
+class _NodeInputCmd(QtGui.QUndoCommand):
+    """
+    Base command for the "BaseNode.on_input_connected()" and
+    "BaseNode.on_input_disconnected()" callbacks.
 
     Args:
         src_port (NodeGraphQt.Port): source port.
@@ -273,89 +445,46 @@ class NodeInputDisconnectedCmd(QtGui.QUndoCommand):
 
     def __init__(self, src_port, trg_port):
         super().__init__()
-        if src_port.dtype == PortTypeEnum.IN.value:
-            self.source = src_port
-            self.target = trg_port
-        else:
-            self.source = trg_port
-            self.target = src_port
+        self.source, self.target = _in_out_ports(src_port, trg_port)
 
-    def undo(self):
+    def _connected(self):
         node = self.source.node
         node.on_input_connected(self.source, self.target)
 
-    def redo(self):
+    def _disconnected(self):
         node = self.source.node
         node.on_input_disconnected(self.source, self.target)
 
 
-class PortConnectedCmd(QtGui.QUndoCommand):
+class NodeInputConnectedCmd(_NodeInputCmd):
     """
-    Port connected command.
+    "BaseNode.on_input_connected()" command.
 
     Args:
         src_port (NodeGraphQt.Port): source port.
         trg_port (NodeGraphQt.Port): target port.
-        emit_signal (bool): emit port connection signals.
     """
 
-    def __init__(self, src_port, trg_port, emit_signal):
-        super().__init__()
-        self.source = src_port
-        self.target = trg_port
-        self.emit_signal = emit_signal
+    undo = _NodeInputCmd._disconnected
+    redo = _NodeInputCmd._connected
 
-    def undo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node.id
-        trg_id = self.target.node.id
-
-        port_names = src_model.connected_ports.get(trg_id)
-        if port_names is []:
-            del src_model.connected_ports[trg_id]
-        if port_names and self.target.name in port_names:
-            port_names.remove(self.target.name)
-
-        port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
-        if port_names and self.source.name in port_names:
-            port_names.remove(self.source.name)
-
-        self.source.view.disconnect_from(self.target.view)
-
-        # emit "port_disconnected" signal from the parent graph.
-        if self.emit_signal:
-            ports = {p.dtype: p for p in [self.source, self.target]}
-            graph = self.source.node.graph
-            graph.port_disconnected.emit(
-                ports[PortTypeEnum.IN.value], ports[PortTypeEnum.OUT.value]
-            )
 
-    def redo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node.id
-        trg_id = self.target.node.id
-
-        src_model.connected_ports[trg_id].append(self.target.name)
-        trg_model.connected_ports[src_id].append(self.source.name)
+class NodeInputDisconnectedCmd(_NodeInputCmd):
+    """
+    Node "on_input_disconnected()" command.
 
-        self.source.view.connect_to(self.target.view)
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+    """
 
-        # emit "port_connected" signal from the parent graph.
-        if self.emit_signal:
-            ports = {p.dtype: p for p in [self.source, self.target]}
-            graph = self.source.node.graph
-            graph.port_connected.emit(
-                ports[PortTypeEnum.IN.value], ports[PortTypeEnum.OUT.value]
-            )
+    undo = _NodeInputCmd._connected
+    redo = _NodeInputCmd._disconnected
 
 
-class PortDisconnectedCmd(QtGui.QUndoCommand):
+class _PortLinkCmd(QtGui.QUndoCommand):
     """
-    Port disconnected command.
+    Base command for connecting and disconnecting two ports.
 
     Args:
         src_port (NodeGraphQt.Port): source port.
@@ -369,52 +498,39 @@ class PortDisconnectedCmd(QtGui.QUndoCommand):
         self.target = trg_port
         self.emit_signal = emit_signal
 
-    def undo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node.id
-        trg_id = self.target.node.id
+    def _connect(self):
+        _connect_ports(self.source, self.target, self.emit_signal)
 
-        src_model.connected_ports[trg_id].append(self.target.name)
-        trg_model.connected_ports[src_id].append(self.source.name)
+    def _disconnect(self):
+        _disconnect_ports(self.source, self.target, self.emit_signal)
 
-        self.source.view.connect_to(self.target.view)
 
-        # emit "port_connected" signal from the parent graph.
-        if self.emit_signal:
-            ports = {p.dtype: p for p in [self.source, self.target]}
-            graph = self.source.node.graph
-            graph.port_connected.emit(
-                ports[PortTypeEnum.IN.value], ports[PortTypeEnum.OUT.value]
-            )
+class PortConnectedCmd(_PortLinkCmd):
+    """
+    Port connected command.
 
-    def redo(self):
-        src_model = self.source.model
-        trg_model = self.target.model
-        src_id = self.source.node.id
-        trg_id = self.target.node.id
-
-        port_names = src_model.connected_ports.get(trg_id)
-        if port_names is []:
-            del src_model.connected_ports[trg_id]
-        if port_names and self.target.name in port_names:
-            port_names.remove(self.target.name)
-
-        port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
-        if port_names and self.source.name in port_names:
-            port_names.remove(self.source.name)
-
-        self.source.view.disconnect_from(self.target.view)
-
-        # emit "port_disconnected" signal from the parent graph.
-        if self.emit_signal:
-            ports = {p.dtype: p for p in [self.source, self.target]}
-            graph = self.source.node.graph
-            graph.port_disconnected.emit(
-                ports[PortTypeEnum.IN.value], ports[PortTypeEnum.OUT.value]
-            )
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+        emit_signal (bool): emit port connection signals.
+    """
+
+    undo = _PortLinkCmd._disconnect
+    redo = _PortLinkCmd._connect
+
+
+class PortDisconnectedCmd(_PortLinkCmd):
+    """
+    Port disconnected command.
+
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+        emit_signal (bool): emit port connection signals.
+    """
+
+    undo = _PortLinkCmd._connect
+    redo = _PortLinkCmd._disconnect
 
 
 class PortLockedCmd(QtGui.QUndoCommand):
@@ -473,19 +589,17 @@ class PortVisibleCmd(QtGui.QUndoCommand):
         super().__init__()
         self.port = port
         self.visible = visible
-        if visible:
-            self.setText(f"show port {self.port.name}")
-        else:
-            self.setText(f"hide port {self.port.name}")
+        label = "show" if visible else "hide"
+        self.setText(f"{label} port {port.name}")
 
     def set_visible(self, visible):
         self.port.model.visible = visible
         self.port.view.setVisible(visible)
         node_view = self.port.node.view
         text_item = None
-        if self.port.dtype == PortTypeEnum.IN.value:
+        if self.port.dtype == _IN:
             text_item = node_view.get_input_text_item(self.port.view)
-        elif self.port.dtype == PortTypeEnum.OUT.value:
+        elif self.port.dtype == _OUT:
             text_item = node_view.get_output_text_item(self.port.view)
         if text_item:
             text_item.setVisible(visible)
@@ -493,12 +607,71 @@ class PortVisibleCmd(QtGui.QUndoCommand):
         node_view.draw_node()
 
         # redraw the connected pipes in the scene.
-        for port in node_view.inputs + node_view.outputs:
-            for pipe in port.connected_pipes:
-                pipe.update()
+        _update_connected_pipes(node_view)
 
     def undo(self):
         self.set_visible(not self.visible)
 
     def redo(self):
         self.set_visible(self.visible)
+
+
+class NodesBulkRemovedCmd(QtGui.QUndoCommand):
+    """
+    Nodes deleted command that also unlocks and disconnects the node ports
+    in the same undo command instead of a macro of per port commands.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        nodes (list[NodeGraphQt.BaseNode or NodeGraphQt.NodeObject]): nodes.
+        ports (list[NodeGraphQt.Port]): ports of the nodes to clear.
+        emit_signal (bool): emit node deletion signals. (default: True)
+    """
+
+    def __init__(self, graph, nodes, ports, emit_signal=True):
+        super().__init__()
+        self.setText("deleted node(s)")
+
+        node_ids = {node.id for node in nodes}
+        self.locked_ports = []
+        # (input port, output port) of the connections to disconnect.
+        self.links = []
+        visited = set()
+        for port in ports:
+            if port.locked():
+                self.locked_ports.append(port)
+            for conn_port in port.connected_ports():
+                link = frozenset((port, conn_port))
+                if link in visited:
+                    continue
+                visited.add(link)
+                # ports on the deleted nodes get unlocked, the others can't
+                # be disconnected while they're locked.
+                if conn_port.locked() and conn_port.node.id not in node_ids:
+                    raise PortError(
+                        f"Can't disconnect port because '{conn_port.name}' is locked."
+                    )
+                self.links.append(_in_out_ports(port, conn_port))
+
+        self.remove_cmd = NodesRemovedCmd(graph, nodes, emit_signal)
+
+    def undo(self):
+        self.remove_cmd.undo()
+        for in_port, out_port in reversed(self.links):
+            # "port_connected" is always emitted like a port reconnection.
+            _connect_ports(in_port, out_port, True)
+            in_port.node.on_input_connected(in_port, out_port)
+        for port in self.locked_ports:
+            port.model.locked = True
+            port.view.locked = True
+
+    def redo(self):
+        for port in self.locked_ports:
+            port.model.locked = False
+            port.view.locked = False
+        for in_port, out_port in self.links:
+            # "port_disconnected" is always emitted like clearing the port
+            # connections.
+            _disconnect_ports(in_port, out_port, True)
+            in_port.node.on_input_disconnected(in_port, out_port)
+        self.remove_cmd.redo()
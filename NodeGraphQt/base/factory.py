@@ -1,3 +1,4 @@
+from bisect import insort
 from typing import Optional
 
 from NodeGraphQt.errors import NodeRegistrationError
@@ -10,9 +11,10 @@ class NodeFactory(object):
     """
 
     def __init__(self):
-        self.__aliases = {}
-        self.__names = {}
-        self.__nodes = {}
+        self._aliases = {}
+        self._names = {}
+        self._nodes = {}
+        self._sorted_types = []
 
     @property
     def names(self):
@@ -22,7 +24,7 @@ class NodeFactory(object):
         Returns:
             dict: key=<node name, value=node_type
         """
-        return self.__names
+        return self._names
 
     @property
     def aliases(self):
@@ -32,7 +34,7 @@ class NodeFactory(object):
         Returns:
             dict: key=alias, value=node type
         """
-        return self.__aliases
+        return self._aliases
 
     @property
     def nodes(self):
@@ -42,7 +44,17 @@ class NodeFactory(object):
         Returns:
             dict: key=node identifier, value=node class
         """
-        return self.__nodes
+        return self._nodes
+
+    @property
+    def sorted_types(self):
+        """
+        Return the registered node type identifiers in sorted order.
+
+        Returns:
+            list[str]: sorted node type identifiers.
+        """
+        return self._sorted_types
 
     def create_node_instance(self, node_type=None):
         """
@@ -57,7 +69,7 @@ class NodeFactory(object):
         if node_type in self.aliases:
             node_type = self.aliases[node_type]
 
-        _NodeClass = self.__nodes.get(node_type)
+        _NodeClass = self._nodes.get(node_type)
         if _NodeClass:
             return _NodeClass()
 
@@ -79,29 +91,48 @@ class NodeFactory(object):
         name = node.NODE_NAME
         node_type = node.dtype()
 
-        if self.__nodes.get(node_type):
+        if node_type in self._nodes:
             raise NodeRegistrationError(
-                f"node type `{node_type}` already registered to `{self.__nodes[node_type]}`! "
+                f"node type `{node_type}` already registered to `{self._nodes[node_type]}`! "
                 "Please specify a new plugin class name or __identifier__."
             )
-        self.__nodes[node_type] = node
-
-        if self.__names.get(name):
-            self.__names[name].append(node_type)
-        else:
-            self.__names[name] = [node_type]
+        if alias and alias in self._aliases:
+            raise NodeRegistrationError(
+                f"Alias: `{alias}` already registered to `{self._aliases[alias]}`"
+            )
 
+        self._nodes[node_type] = node
+        insort(self._sorted_types, node_type)
+        self._names.setdefault(name, []).append(node_type)
         if alias:
-            if self.__aliases.get(alias):
-                raise NodeRegistrationError(
-                    f"Alias: `{alias}` already registered to `{self.__aliases.get(alias)}`"
-                )
-            self.__aliases[alias] = node_type
+            self._aliases[alias] = node_type
+
+    def unregister_node(self, node_type):
+        """
+        unregister the node type and the aliases assigned to it.
+
+        Args:
+            node_type (str): node type identifier.
+        """
+        node = self._nodes.pop(node_type, None)
+        if node is None:
+            return
+        self._sorted_types.remove(node_type)
+
+        node_types = self._names.get(node.NODE_NAME)
+        if node_types and node_type in node_types:
+            node_types.remove(node_type)
+            if not node_types:
+                del self._names[node.NODE_NAME]
+
+        for alias in [a for a, t in self._aliases.items() if t == node_type]:
+            del self._aliases[alias]
 
     def clear_registered_nodes(self):
         """
         clear out registered nodes, to prevent conflicts on reset.
         """
-        self.__nodes.clear()
-        self.__names.clear()
-        self.__aliases.clear()
+        self._nodes.clear()
+        self._sorted_types.clear()
+        self._names.clear()
+        self._aliases.clear()
@@ -1,15 +1,29 @@
+import importlib.util
 import json
 import os
 import re
+import sys
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from operator import methodcaller
 from pathlib import Path
 from typing import List
 
 from PySide6 import QtCore, QtWidgets, QtGui
 
+try:
+    # optional faster json (de)serializer for the session files.
+    import orjson
+except ImportError:
+    orjson = None
+
 from NodeGraphQt.base.commands import (
     NodeAddedCmd,
-    NodesRemovedCmd,
-    NodeMovedCmd,
+    NodesBulkRemovedCmd,
+    NodesDisabledCmd,
+    NodesMovedCmd,
     PortConnectedCmd,
 )
 from NodeGraphQt.base.factory import NodeFactory
@@ -31,6 +45,86 @@ from NodeGraphQt.nodes.base import BaseNode
 from NodeGraphQt.widgets.node_graph import NodeGraphWidget
 from NodeGraphQt.widgets.viewer import NodeViewer
 
+_URI_RE = re.compile(rf"{URI_SCHEME}(?:/*)([\w/]+)(\.\w+)")
+_URN_RE = re.compile(rf"{URN_SCHEME}([\w\.:;]+)")
+_NODE_ID_RE = re.compile(r"node:([\w\.]+)")
+_NAME_VERSION_RE = re.compile(r"\w+ (\d+)$")
+
+_LAYOUT_DIRECTION_VALUES = frozenset(e.value for e in LayoutDirectionEnum)
+_PIPE_LAYOUT_VALUES = frozenset(e.value for e in PipeLayoutEnum)
+
+
+@lru_cache(maxsize=512)
+def _normalize_name(name):
+    """
+    Collapse the whitespace runs of a node name into single spaces, cached
+    as the same base node names are normalized for every new node.
+
+    Args:
+        name (str): node name.
+
+    Returns:
+        str: normalized node name.
+    """
+    return " ".join(name.split())
+
+
+@lru_cache(maxsize=512)
+def _hex_to_rgb(clr):
+    """
+    Convert a hex color string to a rgb tuple.
+
+    Args:
+        clr (str): hex color. `eg.` ``"#ff0000"``
+
+    Returns:
+        tuple(int, int, int): r, g, b
+    """
+    r, g, b = bytes.fromhex(clr.strip("#"))[:3]
+    return r, g, b
+
+
+def _format_color(clr):
+    """
+    Returns the color as a rgb tuple if it's a hex string.
+
+    Args:
+        clr (str or tuple): hex color string or color tuple.
+
+    Returns:
+        tuple: color.
+    """
+    if isinstance(clr, str):
+        return _hex_to_rgb(clr)
+    return clr
+
+
+# clipboard mime type of the nodes copied from a node graph.
+_CLIPBOARD_MIME_TYPE = "application/x-nodegraphqt"
+
+
+def _json_default(obj):
+    """
+    Serialize the objects the json encoders don't support, the connection
+    constrains port names are stored as sets.
+
+    Args:
+        obj (object): object to serialize.
+
+    Returns:
+        list: sorted set items.
+    """
+    if isinstance(obj, set):
+        return sorted(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj)}")
+
+
+# port type -> callable returning the node's port dict for that type.
+_NODE_PORTS_GETTER = {
+    PortTypeEnum.IN.value: methodcaller("inputs"),
+    PortTypeEnum.OUT.value: methodcaller("outputs"),
+}
+
 
 class NodeGraph(QtCore.QObject):
     """
@@ -133,6 +227,10 @@ class NodeGraph(QtCore.QObject):
     :emits: triggered context menu, node object.
     """
 
+    # modules loaded for the serialized context menu commands.
+    # {<resolved file path>: <module>}
+    _menu_module_cache = {}
+
     def __init__(self, parent=None, **kwargs):
         """
         Args:
@@ -148,10 +246,12 @@ class NodeGraph(QtCore.QObject):
         self._widget = None
         self._sub_graphs = {}
         self._viewer = kwargs.get("viewer") or NodeViewer(undo_stack=self._undo_stack)
+        self._update_depth = 0
+        self._update_pending = False
 
         layout_direction = kwargs.get("layout_direction")
         if layout_direction:
-            if layout_direction not in [e.value for e in LayoutDirectionEnum]:
+            if layout_direction not in _LAYOUT_DIRECTION_VALUES:
                 layout_direction = LayoutDirectionEnum.HORIZONTAL.value
             self._model.layout_direction = layout_direction
         else:
@@ -160,7 +260,7 @@ class NodeGraph(QtCore.QObject):
 
         pipe_style = kwargs.get("pipe_style")
         if pipe_style is not None:
-            if pipe_style not in [e.value for e in PipeLayoutEnum]:
+            if pipe_style not in _PIPE_LAYOUT_VALUES:
                 pipe_style = PipeLayoutEnum.CURVED.value
             self._model.pipe_style = pipe_style
         else:
@@ -172,7 +272,8 @@ class NodeGraph(QtCore.QObject):
         self._viewer.accept_connection_types = self._model.accept_connection_types
         self._viewer.reject_connection_types = self._model.reject_connection_types
 
-        self._context_menu = {}
+        self._graph_menu = None
+        self._nodes_menu = None
 
         self._register_context_menu()
         # TODO: drop node Not ready yet.
@@ -192,29 +293,35 @@ class NodeGraph(QtCore.QObject):
             return
         menus = self._viewer.context_menus()
         if menus.get("graph"):
-            self._context_menu["graph"] = NodeGraphMenu(self, menus["graph"])
+            self._graph_menu = NodeGraphMenu(self, menus["graph"])
         if menus.get("nodes"):
-            self._context_menu["nodes"] = NodesMenu(self, menus["nodes"])
+            self._nodes_menu = NodesMenu(self, menus["nodes"])
 
     def _wire_signals(self):
         """
         Connect up all the signals and slots here.
         """
+        # the viewer always lives in the same thread as the node graph so the
+        # slots can be invoked directly.
+        direct = QtCore.Qt.ConnectionType.DirectConnection
+        viewer = self._viewer
 
         # internal signals.
-        self._viewer.search_triggered.connect(self._on_search_triggered)
-        self._viewer.connection_sliced.connect(self._on_connection_sliced)
-        self._viewer.connection_changed.connect(self._on_connection_changed)
-        self._viewer.moved_nodes.connect(self._on_nodes_moved)
-        self._viewer.node_double_clicked.connect(self._on_node_double_clicked)
-        self._viewer.node_name_changed.connect(self._on_node_name_changed)
-        self._viewer.insert_node.connect(self._on_insert_node)
+        viewer.search_triggered.connect(self._on_search_triggered, type=direct)
+        viewer.connection_sliced.connect(self._on_connection_sliced, type=direct)
+        viewer.connection_changed.connect(self._on_connection_changed, type=direct)
+        viewer.moved_nodes.connect(self._on_nodes_moved, type=direct)
+        viewer.node_double_clicked.connect(self._on_node_double_clicked, type=direct)
+        viewer.node_name_changed.connect(self._on_node_name_changed, type=direct)
+        viewer.insert_node.connect(self._on_insert_node, type=direct)
 
         # pass through translated signals.
-        self._viewer.node_selected.connect(self._on_node_selected)
-        self._viewer.node_selection_changed.connect(self._on_node_selection_changed)
-        self._viewer.data_dropped.connect(self._on_node_data_dropped)
-        self._viewer.context_menu_prompt.connect(self._on_context_menu_prompt)
+        viewer.node_selected.connect(self._on_node_selected, type=direct)
+        viewer.node_selection_changed.connect(
+            self._on_node_selection_changed, type=direct
+        )
+        viewer.data_dropped.connect(self._on_node_data_dropped, type=direct)
+        viewer.context_menu_prompt.connect(self._on_context_menu_prompt, type=direct)
 
     def _on_context_menu_prompt(self, menu_name, node_id):
         """
@@ -302,8 +409,9 @@ class NodeGraph(QtCore.QObject):
             sel_ids (list[str]): new selected node ids.
             desel_ids (list[str]): deselected node ids.
         """
-        sel_nodes = [self.get_node_by_id(nid) for nid in sel_ids]
-        unsel_nodes = [self.get_node_by_id(nid) for nid in desel_ids]
+        get_node = self._model.nodes.get
+        sel_nodes = list(map(get_node, sel_ids))
+        unsel_nodes = list(map(get_node, desel_ids))
         self.node_selection_changed.emit(sel_nodes, unsel_nodes)
 
     def _on_node_data_dropped(self, mimedata, pos):
@@ -318,20 +426,19 @@ class NodeGraph(QtCore.QObject):
             mimedata (QtCore.QMimeData): mime data.
             pos (QtCore.QPoint): scene position relative to the drop.
         """
-        uri_regex = re.compile(rf"{URI_SCHEME}(?:/*)([\w/]+)(\.\w+)")
-        urn_regex = re.compile(rf"{URN_SCHEME}([\w\.:;]+)")
-        if mimedata.hasFormat(MIME_TYPE):
+        formats = set(mimedata.formats())
+        if MIME_TYPE in formats:
             data = mimedata.data(MIME_TYPE).data().decode()
-            urn_search = urn_regex.search(data)
+            # cheap substring check before running the regex.
+            urn_search = URN_SCHEME in data and _URN_RE.search(data)
             if urn_search:
                 search_str = urn_search.group(1)
-                node_ids = sorted(re.findall(r"node:([\w\.]+)", search_str))
+                node_ids = sorted(m[1] for m in _NODE_ID_RE.finditer(search_str))
                 x, y = pos.x(), pos.y()
-                for node_id in node_ids:
-                    self.create_node(node_id, pos=[x, y])
-                    x += 80
-                    y += 80
-        elif mimedata.hasFormat("text/uri-list"):
+                for i, node_id in enumerate(node_ids):
+                    offset = i * 80
+                    self.create_node(node_id, pos=[x + offset, y + offset])
+        elif "text/uri-list" in formats:
             not_supported_urls = []
             for url in mimedata.urls():
                 local_file = url.toLocalFile()
@@ -343,8 +450,8 @@ class NodeGraph(QtCore.QObject):
                         not_supported_urls.append(url)
 
                 url_str = url.toString()
-                if url_str:
-                    uri_search = uri_regex.search(url_str)
+                if URI_SCHEME in url_str:
+                    uri_search = _URI_RE.search(url_str)
                     if uri_search:
                         path = uri_search.group(1)
                         ext = uri_search.group(2)
@@ -370,12 +477,17 @@ class NodeGraph(QtCore.QObject):
         Args:
             node_data (dict): {<node_view>: <previous_pos>}
         """
-        self._undo_stack.beginMacro("move nodes")
-        for node_view, prev_pos in node_data.items():
-            node = self._model.nodes[node_view.id]
-            # TODO: n.x_pos(), n.y_pos() -> n.view.xy_pos
-            self._undo_stack.push(NodeMovedCmd(node, node.view.xy_pos, prev_pos))
-        self._undo_stack.endMacro()
+        nodes = self._model.nodes
+        # TODO: n.x_pos(), n.y_pos() -> n.view.xy_pos
+        moves = [
+            (nodes[node_view.id], node_view.xy_pos, prev_pos)
+            for node_view, prev_pos in node_data.items()
+        ]
+        undo_cmd = NodesMovedCmd(moves)
+        # nothing moved, don't push an empty command.
+        if not undo_cmd.moves:
+            return
+        self._undo_stack.push(undo_cmd)
 
     def _on_search_triggered(self, node_type, pos):
         """
@@ -401,20 +513,13 @@ class NodeGraph(QtCore.QObject):
             return
 
         label = "connect node(s)" if connected else "disconnect node(s)"
-        ptypes = {PortTypeEnum.IN.value: "inputs", PortTypeEnum.OUT.value: "outputs"}
+        disconnected = self._ports_from_views(disconnected)
+        connected = self._ports_from_views(connected)
 
         self._undo_stack.beginMacro(label)
-        for p1_view, p2_view in disconnected:
-            node1 = self._model.nodes[p1_view.node.id]
-            node2 = self._model.nodes[p2_view.node.id]
-            port1 = getattr(node1, ptypes[p1_view.port_type])()[p1_view.name]
-            port2 = getattr(node2, ptypes[p2_view.port_type])()[p2_view.name]
+        for port1, port2 in disconnected:
             port1.disconnect_from(port2)
-        for p1_view, p2_view in connected:
-            node1 = self._model.nodes[p1_view.node.id]
-            node2 = self._model.nodes[p2_view.node.id]
-            port1 = getattr(node1, ptypes[p1_view.port_type])()[p1_view.name]
-            port2 = getattr(node2, ptypes[p2_view.port_type])()[p2_view.name]
+        for port1, port2 in connected:
             port1.connect_to(port2)
         self._undo_stack.endMacro()
 
@@ -428,16 +533,38 @@ class NodeGraph(QtCore.QObject):
         """
         if not ports:
             return
-        ptypes = {PortTypeEnum.IN.value: "inputs", PortTypeEnum.OUT.value: "outputs"}
+        ports = self._ports_from_views(ports)
+
         self._undo_stack.beginMacro("slice connections")
-        for p1_view, p2_view in ports:
-            node1 = self._model.nodes[p1_view.node.id]
-            node2 = self._model.nodes[p2_view.node.id]
-            port1 = getattr(node1, ptypes[p1_view.port_type])()[p1_view.name]
-            port2 = getattr(node2, ptypes[p2_view.port_type])()[p2_view.name]
+        for port1, port2 in ports:
             port1.disconnect_from(port2)
         self._undo_stack.endMacro()
 
+    def _ports_from_views(self, port_view_pairs):
+        """
+        Returns the port objects for pairs of port view items, each node
+        port dict is only built once.
+
+        Args:
+            port_view_pairs (list[list[widgets.port.PortItem]]):
+                pair list of port view items.
+
+        Returns:
+            list[tuple(NodeGraphQt.Port, NodeGraphQt.Port)]: port pairs.
+        """
+        nodes = self._model.nodes
+        port_dicts = {}
+
+        def get_port(port_view):
+            key = (port_view.node.id, port_view.port_type)
+            node_ports = port_dicts.get(key)
+            if node_ports is None:
+                get_ports = _NODE_PORTS_GETTER[key[1]]
+                node_ports = port_dicts[key] = get_ports(nodes[key[0]])
+            return node_ports[port_view.name]
+
+        return [(get_port(p1), get_port(p2)) for p1, p2 in port_view_pairs]
+
     @property
     def model(self):
         """
@@ -471,11 +598,8 @@ class NodeGraph(QtCore.QObject):
             self._widget.addTab(self._viewer, "Node Graph")
             # hide the close button on the first tab.
             tab_bar = self._widget.tabBar()
-            tab_flags = [
-                QtWidgets.QTabBar.ButtonPosition.RightSide,
-                QtWidgets.QTabBar.ButtonPosition.LeftSide,
-            ]
-            for btn_flag in tab_flags:
+            ButtonPosition = QtWidgets.QTabBar.ButtonPosition
+            for btn_flag in (ButtonPosition.RightSide, ButtonPosition.LeftSide):
                 tab_btn = tab_bar.tabButton(0, btn_flag)
                 if tab_btn:
                     tab_btn.deleteLater()
@@ -557,6 +681,45 @@ class NodeGraph(QtCore.QObject):
         """
         return self._viewer.scene()
 
+    @contextmanager
+    def batch_viewer_updates(self):
+        """
+        Context manager that defers the viewer redraw until the block exits
+        so multiple viewer settings only redraw the scene once.
+
+        Example:
+
+        .. code-block:: python
+            :linenos:
+
+            with graph.batch_viewer_updates():
+                graph.set_background_color(20, 20, 20)
+                graph.set_grid_color(40, 40, 40)
+                graph.set_grid_mode(ViewerEnum.GRID_DISPLAY_DOTS.value)
+        """
+        self._update_depth += 1
+        if self._update_depth == 1:
+            # also hold back the incremental repaints of the viewer widget.
+            self._viewer.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if not self._update_depth:
+                self._viewer.setUpdatesEnabled(True)
+                if self._update_pending:
+                    self._update_pending = False
+                    self._viewer.force_update()
+
+    def _update_viewer(self):
+        """
+        Redraw the viewer or defer it when inside :meth:`batch_viewer_updates`.
+        """
+        if self._update_depth:
+            self._update_pending = True
+            return
+        self._viewer.force_update()
+
     def background_color(self):
         """
         Return the node graph background color.
@@ -576,7 +739,7 @@ class NodeGraph(QtCore.QObject):
             b (int): blue value.
         """
         self.scene().background_color = (r, g, b)
-        self._viewer.force_update()
+        self._update_viewer()
 
     def grid_color(self):
         """
@@ -597,7 +760,7 @@ class NodeGraph(QtCore.QObject):
             b (int): blue value.
         """
         self.scene().grid_color = (r, g, b)
-        self._viewer.force_update()
+        self._update_viewer()
 
     def set_grid_mode(self, mode=None):
         """
@@ -624,7 +787,7 @@ class NodeGraph(QtCore.QObject):
         if mode not in display_types:
             mode = ViewerEnum.GRID_DISPLAY_LINES.value
         self.scene().grid_mode = mode
-        self._viewer.force_update()
+        self._update_viewer()
 
     def undo_stack(self):
         """
@@ -683,7 +846,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             NodeGraphQt.NodeGraphMenu: context menu object.
         """
-        return self.get_context_menu("graph")
+        return self._graph_menu
 
     def context_nodes_menu(self):
         """
@@ -697,7 +860,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             NodeGraphQt.NodesMenu: context menu object.
         """
-        return self.get_context_menu("nodes")
+        return self._nodes_menu
 
     def get_context_menu(self, menu):
         """
@@ -714,7 +877,10 @@ class NodeGraph(QtCore.QObject):
         Returns:
             NodeGraphQt.NodeGraphMenu or NodeGraphQt.NodesMenu: context menu object.
         """
-        return self._context_menu.get(menu)
+        if menu == "graph":
+            return self._graph_menu
+        if menu == "nodes":
+            return self._nodes_menu
 
     def _deserialize_context_menu(self, menu, menu_data, anchor_path=None):
         """
@@ -729,9 +895,6 @@ class NodeGraph(QtCore.QObject):
         if not menu:
             raise ValueError('No context menu named: "{}"'.format(menu))
 
-        import sys
-        import importlib.util
-
         nodes_menu = self.get_context_menu("nodes")
 
         anchor = Path(anchor_path).resolve()
@@ -750,16 +913,21 @@ class NodeGraph(QtCore.QObject):
             func_path = Path(data["file"])
             if not func_path.is_absolute():
                 func_path = anchor.joinpath(func_path)
+            func_path = func_path.resolve()
 
-            base_name = func_path.parent.name
-            file_name = func_path.stem
+            # only load each module once when multiple commands share a file.
+            mod = NodeGraph._menu_module_cache.get(func_path)
+            if mod is None:
+                base_name = func_path.parent.name
+                file_name = func_path.stem
 
-            mod_name = "{}.{}".format(base_name, file_name)
+                mod_name = "{}.{}".format(base_name, file_name)
 
-            spec = importlib.util.spec_from_file_location(mod_name, func_path)
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[mod_name] = mod
-            spec.loader.exec_module(mod)
+                spec = importlib.util.spec_from_file_location(mod_name, func_path)
+                mod = importlib.util.module_from_spec(spec)
+                sys.modules[mod_name] = mod
+                spec.loader.exec_module(mod)
+                NodeGraph._menu_module_cache[func_path] = mod
 
             cmd_func = getattr(mod, data["function_name"])
             cmd_name = data.get("label") or "<command>"
@@ -847,8 +1015,7 @@ class NodeGraph(QtCore.QObject):
         if not file.is_file():
             raise IOError('file doesn\'t exist: "{}"'.format(file))
 
-        with file.open(encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(file.read_bytes())
         context_menu = self.get_context_menu(menu)
         self._deserialize_context_menu(context_menu, data, file)
 
@@ -866,15 +1033,16 @@ class NodeGraph(QtCore.QObject):
             disabled (bool): true to enable context menu.
             name (str): menu name. (default: ``"all"``)
         """
+        menus = self._viewer.context_menus()
         if name == "all":
-            for _, menu in self._viewer.context_menus().items():
+            for menu in menus.values():
                 menu.setDisabled(disabled)
                 menu.setVisible(not disabled)
             return
-        menus = self._viewer.context_menus()
-        if menus.get(name):
-            menus[name].setDisabled(disabled)
-            menus[name].setVisible(not disabled)
+        menu = menus.get(name)
+        if menu:
+            menu.setDisabled(disabled)
+            menu.setVisible(not disabled)
 
     def acyclic(self):
         """
@@ -1044,11 +1212,10 @@ class NodeGraph(QtCore.QObject):
         Args:
             direction (int): layout direction.
         """
-        direction_types = [e.value for e in LayoutDirectionEnum]
-        if direction not in direction_types:
+        if direction not in _LAYOUT_DIRECTION_VALUES:
             direction = LayoutDirectionEnum.HORIZONTAL.value
         self._model.layout_direction = direction
-        for node in self.all_nodes():
+        for node in self._iter_nodes():
             node.set_layout_direction(direction)
         self._viewer.set_layout_direction(direction)
 
@@ -1113,7 +1280,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             list[str]: list of node type identifiers.
         """
-        return sorted(self._node_factory.nodes.keys())
+        return list(self._node_factory.sorted_types)
 
     def register_node(self, node, alias=None):
         """
@@ -1173,8 +1340,8 @@ class NodeGraph(QtCore.QObject):
             node._graph = self
             node.model._graph_model = self.model
 
-            wid_types = node.model._property_widget_types
-            prop_attrs = node.model._property_attrs
+            wid_types = node.model.property_widget_types
+            prop_attrs = node.model.property_attrs
             node_type = node.dtype()
 
             if self.model.get_node_common_properties(node_type) is None:
@@ -1189,16 +1356,10 @@ class NodeGraph(QtCore.QObject):
             node.model.name = node.NODE_NAME
             node.model.selected = selected
 
-            def format_color(clr):
-                if isinstance(clr, str):
-                    clr = clr.strip("#")
-                    return tuple(int(clr[i : i + 2], 16) for i in (0, 2, 4))
-                return clr
-
             if color:
-                node.model.color = format_color(color)
+                node.model.color = _format_color(color)
             if text_color:
-                node.model.text_color = format_color(text_color)
+                node.model.text_color = _format_color(text_color)
             if pos:
                 node.model.pos = [float(pos[0]), float(pos[1])]
 
@@ -1208,15 +1369,21 @@ class NodeGraph(QtCore.QObject):
             node.update()
 
             undo_cmd = NodeAddedCmd(self, node, pos=node.model.pos, emit_signal=True)
+            selected_nodes = self.selected_nodes()
             if push_undo:
-                undo_label = f"create node: '{node.NODE_NAME}'"
-                self._undo_stack.beginMacro(undo_label)
-                for n in self.selected_nodes():
-                    n.set_property("selected", False, push_undo=True)
-                self._undo_stack.push(undo_cmd)
-                self._undo_stack.endMacro()
+                undo_label = "create node: '%s'"
+                if selected_nodes:
+                    self._undo_stack.beginMacro(undo_label % node.NODE_NAME)
+                    for n in selected_nodes:
+                        n.set_property("selected", False, push_undo=True)
+                    self._undo_stack.push(undo_cmd)
+                    self._undo_stack.endMacro()
+                else:
+                    # nothing to deselect so no need for the macro.
+                    undo_cmd.setText(undo_label % node.NODE_NAME)
+                    self._undo_stack.push(undo_cmd)
             else:
-                for n in self.selected_nodes():
+                for n in selected_nodes:
                     n.set_property("selected", False, push_undo=False)
                 undo_cmd.redo()
 
@@ -1236,8 +1403,8 @@ class NodeGraph(QtCore.QObject):
         """
         assert isinstance(node, NodeObject), "node must be a Node instance."
 
-        wid_types = node.model._property_widget_types
-        prop_attrs = node.model._property_attrs
+        wid_types = node.model.property_widget_types
+        prop_attrs = node.model.property_attrs
         node_type = node.dtype()
 
         if self.model.get_node_common_properties(node_type) is None:
@@ -1280,27 +1447,10 @@ class NodeGraph(QtCore.QObject):
             push_undo (bool): register the command to the undo stack. (default: True)
         """
         assert isinstance(node, NodeObject), "node must be a instance of a NodeObject."
-
-        if push_undo:
-            # TODO: node.name() -> node.view.name
-            self._undo_stack.beginMacro(f"delete node: '{node.view.name}'")
-
-        if isinstance(node, BaseNode):
-            for p in node.input_ports():
-                if p.locked():
-                    p.set_locked(False, connected_ports=False, push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-            for p in node.output_ports():
-                if p.locked():
-                    p.set_locked(False, connected_ports=False, push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-
-        undo_cmd = NodesRemovedCmd(self, [node], emit_signal=True)
-        if push_undo:
-            self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
-        else:
-            undo_cmd.redo()
+        # TODO: node.name() -> node.view.name
+        self._remove_nodes(
+            [node], push_undo, True, "delete node: '%s'", node.view.name
+        )
 
     def remove_node(self, node, push_undo=True):
         """
@@ -1315,27 +1465,10 @@ class NodeGraph(QtCore.QObject):
 
         """
         assert isinstance(node, NodeObject), "node must be a Node instance."
-
-        if push_undo:
-            # TODO: node.name() -> node.view.name
-            self._undo_stack.beginMacro(f"delete node: '{node.view.name}'")
-
-        if isinstance(node, BaseNode):
-            for p in node.input_ports():
-                if p.locked():
-                    p.set_locked(False, connected_ports=False, push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-            for p in node.output_ports():
-                if p.locked():
-                    p.set_locked(False, connected_ports=False, push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-
-        undo_cmd = NodesRemovedCmd(self, [node], emit_signal=False)
-        if push_undo:
-            self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
-        else:
-            undo_cmd.redo()
+        # TODO: node.name() -> node.view.name
+        self._remove_nodes(
+            [node], push_undo, False, "delete node: '%s'", node.view.name
+        )
 
     def delete_nodes(self, nodes, push_undo=True):
         """
@@ -1351,28 +1484,33 @@ class NodeGraph(QtCore.QObject):
             self.delete_node(nodes[0], push_undo=push_undo)
             return
         node_ids = [n.id for n in nodes]
-        if push_undo:
-            self._undo_stack.beginMacro(f"deleted '{len(nodes)}' node(s)")
-        for node in nodes:
+        self._remove_nodes(nodes, push_undo, True, "deleted '%s' node(s)", len(nodes))
+        self.nodes_deleted.emit(node_ids)
 
+    def _remove_nodes(self, nodes, push_undo, emit_signal, text_fmt, *text_args):
+        """
+        Unlock and disconnect the node ports then remove the nodes with a
+        single undo command.
+        (used internally by the node graph)
+
+        Args:
+            nodes (list[NodeGraphQt.NodeObject]): nodes to remove.
+            push_undo (bool): register the command to the undo stack.
+            emit_signal (bool): emit the node deletion signals.
+            text_fmt (str): undo command text template.
+            *text_args: undo command text template arguments.
+        """
+        ports = []
+        for node in nodes:
             if isinstance(node, BaseNode):
-                for p in node.input_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False, push_undo=push_undo)
-                    p.clear_connections(push_undo=push_undo)
-                for p in node.output_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False, push_undo=push_undo)
-                    p.clear_connections(push_undo=push_undo)
-
-        undo_cmd = NodesRemovedCmd(self, nodes, emit_signal=True)
-        if push_undo:
-            self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
-        else:
-            undo_cmd.redo()
+                ports.extend(chain(node.input_ports(), node.output_ports()))
 
-        self.nodes_deleted.emit(node_ids)
+        undo_cmd = NodesBulkRemovedCmd(self, nodes, ports, emit_signal=emit_signal)
+        if not push_undo:
+            undo_cmd.redo()
+            return
+        undo_cmd.setText(text_fmt % text_args)
+        self._undo_stack.push(undo_cmd)
 
     def extract_nodes(self, nodes, push_undo=True, prompt_warning=True):
         """
@@ -1392,7 +1530,7 @@ class NodeGraph(QtCore.QObject):
             if not isinstance(node, BaseNode):
                 continue
 
-            for port in node.input_ports() + node.output_ports():
+            for port in chain(node.input_ports(), node.output_ports()):
                 if port.locked():
                     locked_ports.append("{0.node.name}: {0.name}".format(port))
 
@@ -1410,10 +1548,11 @@ class NodeGraph(QtCore.QObject):
         if push_undo:
             self._undo_stack.beginMacro('extracted "{}" node(s)'.format(len(nodes)))
 
+        node_ids = {node.id for node in base_nodes}
         for node in base_nodes:
-            for port in node.input_ports() + node.output_ports():
+            for port in chain(node.input_ports(), node.output_ports()):
                 for connected_port in port.connected_ports():
-                    if connected_port.node() in base_nodes:
+                    if connected_port.node.id in node_ids:
                         continue
                     port.disconnect_from(connected_port, push_undo=push_undo)
 
@@ -1429,6 +1568,17 @@ class NodeGraph(QtCore.QObject):
         """
         return list(self._model.nodes.values())
 
+    def _iter_nodes(self):
+        """
+        Returns a view of the nodes in the node graph without copying them
+        into a list, the nodes must not be added or removed while iterating.
+        (used internally by the node graph)
+
+        Returns:
+            dict_values: node objects.
+        """
+        return self._model.nodes.values()
+
     def selected_nodes(self):
         """
         Return all selected nodes that are in the node graph.
@@ -1446,21 +1596,17 @@ class NodeGraph(QtCore.QObject):
         """
         Select all nodes in the node graph.
         """
-        self._undo_stack.beginMacro("select all")
-        for node in self.all_nodes():
+        for node in self._iter_nodes():
             # TODO: node.set_selected() -> node.view.selected
             node.view.selected = True
-        self._undo_stack.endMacro()
 
     def clear_selection(self):
         """
         Clears the selection in the node graph.
         """
-        self._undo_stack.beginMacro("clear selection")
-        for node in self.all_nodes():
+        for node in self.selected_nodes():
             # TODO: node.set_selected() -> node.view.selected
             node.view.selected = False
-        self._undo_stack.endMacro()
 
     def invert_selection(self):
         """
@@ -1469,11 +1615,9 @@ class NodeGraph(QtCore.QObject):
         if not self.selected_nodes():
             self.select_all()
             return
-        self._undo_stack.beginMacro("invert selection")
-        for node in self.all_nodes():
+        for node in self._iter_nodes():
             # TODO: node.set_selected() -> node.view.selected
             node.view.selected = not node.selected()
-        self._undo_stack.endMacro()
 
     def get_node_by_id(self, node_id=None):
         """
@@ -1496,10 +1640,21 @@ class NodeGraph(QtCore.QObject):
         Returns:
             NodeGraphQt.NodeObject: node object.
         """
-        for node in self._model.nodes.values():
+        nodes_by_name = self._model.nodes_by_name
+        node = nodes_by_name.get(name)
+        if node is not None:
             # TODO: node.name() -> node.view.name
             if node.view.name == name:
                 return node
+            # stale entry of a node renamed without a property changed command.
+            del nodes_by_name[name]
+
+        # fall back to a scan for a view renamed outside of the name index
+        # and repair the index.
+        for node in self._model.nodes.values():
+            if node.view.name == name:
+                nodes_by_name[name] = node
+                return node
 
     def get_nodes_by_type(self, node_type):
         """
@@ -1512,7 +1667,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             list[NodeGraphQt.NodeObject]: list of nodes.
         """
-        return [n for n in self._model.nodes.values() if n.dtype == node_type]
+        return list(self._model.nodes_by_type.get(node_type, {}).values())
 
     def get_unique_name(self, name):
         """
@@ -1524,22 +1679,18 @@ class NodeGraph(QtCore.QObject):
         Returns:
             str: unique node name.
         """
-        name = " ".join(name.split())
+        name = _normalize_name(name)
+        # read the names from the views, the name index goes stale when a
+        # view is renamed directly.
         # TODO: n.name() -> n.view.name
-        node_names = [n.view.name for n in self.all_nodes()]
+        node_names = {n.view.name for n in self._model.nodes.values()}
         if name not in node_names:
             return name
 
-        regex = re.compile(r"\w+ (\d+)$")
-        search = regex.search(name)
-        if not search:
-            for x in range(1, len(node_names) + 2):
-                new_name = f"{name} {x}"
-                if new_name not in node_names:
-                    return new_name
-
-        version = search.group(1)
-        name = name[: len(version) * -1].strip()
+        # strip the existing version number before probing for a free one.
+        search = _NAME_VERSION_RE.search(name)
+        if search:
+            name = name[: search.start(1)].strip()
         for x in range(1, len(node_names) + 2):
             new_name = f"{name} {x}"
             if new_name not in node_names:
@@ -1558,18 +1709,9 @@ class NodeGraph(QtCore.QObject):
         """
         Clears the current node graph session.
         """
-        nodes = self.all_nodes()
-        for n in nodes:
-            if isinstance(n, BaseNode):
-                for p in n.input_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-                for p in n.output_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-        self._undo_stack.push(NodesRemovedCmd(self, nodes))
+        # the undo stack is cleared right after so there's no need to push
+        # the command.
+        self._remove_nodes(self.all_nodes(), False, True, "clear session")
         self._undo_stack.clear()
         self._model.session = ""
 
@@ -1608,6 +1750,9 @@ class NodeGraph(QtCore.QObject):
             node.update_model()
             nodes_data.update({node.model.id: node.model.properties})
 
+        # (in node id, in port name, out node id, out port name) of the
+        # serialized connections, each pipe is visited from both ends.
+        serialized_pipes = set()
         for n_id, n_data in nodes_data.items():
             serial_data["nodes"][n_id] = n_data
 
@@ -1618,29 +1763,35 @@ class NodeGraph(QtCore.QObject):
             for pname, conn_data in inputs.items():
                 for conn_id, prt_names in conn_data.items():
                     for conn_prt in prt_names:
+                        pipe_key = (n_id, pname, conn_id, conn_prt)
+                        if pipe_key in serialized_pipes:
+                            continue
+                        serialized_pipes.add(pipe_key)
                         pipe = {
                             PortTypeEnum.IN.value: [n_id, pname],
                             PortTypeEnum.OUT.value: [conn_id, conn_prt],
                         }
-                        if pipe not in serial_data["connections"]:
-                            serial_data["connections"].append(pipe)
+                        serial_data["connections"].append(pipe)
 
             for pname, conn_data in outputs.items():
                 for conn_id, prt_names in conn_data.items():
                     for conn_prt in prt_names:
+                        pipe_key = (conn_id, conn_prt, n_id, pname)
+                        if pipe_key in serialized_pipes:
+                            continue
+                        serialized_pipes.add(pipe_key)
                         pipe = {
                             PortTypeEnum.OUT.value: [n_id, pname],
                             PortTypeEnum.IN.value: [conn_id, conn_prt],
                         }
-                        if pipe not in serial_data["connections"]:
-                            serial_data["connections"].append(pipe)
+                        serial_data["connections"].append(pipe)
 
         if not serial_data["connections"]:
             serial_data.pop("connections")
 
         return serial_data
 
-    def _deserialize(self, data, relative_pos=False, pos=None):
+    def _deserialize(self, data, relative_pos=False, pos=None, push_undo=True):
         """
         deserialize node data.
         (used internally by the node graph)
@@ -1649,94 +1800,130 @@ class NodeGraph(QtCore.QObject):
             data (dict): node data.
             relative_pos (bool): position node relative to the cursor.
             pos (tuple or list): custom x, y position.
+            push_undo (bool): register the nodes and connections to the
+                undo stack under a single macro. (default: True)
 
         Returns:
             list[NodeGraphQt.Nodes]: list of node instances.
         """
-        # update node graph properties.
-        for attr_name, attr_value in data.get("graph", {}).items():
-            if attr_name == "layout_direction":
-                self.set_layout_direction(attr_value)
-            elif attr_name == "acyclic":
-                self.set_acyclic(attr_value)
-            elif attr_name == "pipe_collision":
-                self.set_pipe_collision(attr_value)
-            elif attr_name == "pipe_slicing":
-                self.set_pipe_slicing(attr_value)
-            elif attr_name == "pipe_style":
-                self.set_pipe_style(attr_value)
-
-            # connection constrains.
-            elif attr_name == "accept_connection_types":
-                self.model.accept_connection_types = attr_value
-            elif attr_name == "reject_connection_types":
-                self.model.reject_connection_types = attr_value
-
-        # build the nodes.
-        nodes = {}
-        for n_id, n_data in data.get("nodes", {}).items():
-            identifier = n_data["dtype"]
-            node = self._node_factory.create_node_instance(identifier)
-            if node:
-                node.NODE_NAME = n_data.get("name", node.NODE_NAME)
-                # set properties.
-                for prop in node.model.properties:
-                    if prop in n_data:
-                        node.model.set_property(prop, n_data[prop])
-                # set custom properties.
-                for prop, val in n_data.get("custom", {}).items():
-                    node.model.set_property(prop, val)
-                    if isinstance(node, BaseNode):
-                        if prop in node.view.widgets:
-                            node.view.widgets[prop].set_value(val)
-
-                nodes[n_id] = node
-                self.add_node(node, n_data.get("pos"))
-
-                if n_data.get("port_deletion_allowed", None):
-                    node.set_ports(
-                        {
-                            "input_ports": n_data["input_ports"],
-                            "output_ports": n_data["output_ports"],
-                        }
-                    )
-
-        # build the connections.
-        for connection in data.get("connections", []):
-            nid, pname = connection.get("in", ("", ""))
-            in_node = nodes.get(nid) or self.get_node_by_id(nid)
-            if not in_node:
-                continue
-            in_port = in_node.inputs().get(pname) if in_node else None
+        with self.batch_viewer_updates():
+            # update node graph properties.
+            graph_attrs = data.get("graph")
+            if graph_attrs:
+                model = self.model
+                attr_setters = {
+                    "layout_direction": self.set_layout_direction,
+                    "acyclic": self.set_acyclic,
+                    "pipe_collision": self.set_pipe_collision,
+                    "pipe_slicing": self.set_pipe_slicing,
+                    "pipe_style": self.set_pipe_style,
+                    # connection constrains.
+                    "accept_connection_types": model.set_accept_connection_types,
+                    "reject_connection_types": model.set_reject_connection_types,
+                }
+                for attr_name, attr_value in graph_attrs.items():
+                    setter = attr_setters.get(attr_name)
+                    if setter:
+                        setter(attr_value)
 
-            nid, pname = connection.get("out", ("", ""))
-            out_node = nodes.get(nid) or self.get_node_by_id(nid)
-            if not out_node:
-                continue
-            out_port = out_node.outputs().get(pname) if out_node else None
-
-            if in_port and out_port:
-                # only connect if input port is not connected yet or input port
-                # can have multiple connections.
-                # important when duplicating nodes.
-                allow_connection = any(
-                    [not in_port.model.connected_ports, in_port.model.multi_connection]
-                )
-                if allow_connection:
-                    self._undo_stack.push(
-                        PortConnectedCmd(in_port, out_port, emit_signal=False)
+            if push_undo:
+                self._undo_stack.beginMacro("deserialize nodes")
+
+            # build the nodes.
+            nodes = {}
+            # default property names per node type.
+            valid_props = {}
+            for n_id, n_data in data.get("nodes", {}).items():
+                identifier = n_data["dtype"]
+                node = self._node_factory.create_node_instance(identifier)
+                if node:
+                    node.NODE_NAME = n_data.get("name", node.NODE_NAME)
+                    # set properties.
+                    node_props = valid_props.get(identifier)
+                    if node_props is None:
+                        # keep the new node id, connections are mapped by the
+                        # serialized ids.
+                        node_props = node.model.property_names() - {"id"}
+                        valid_props[identifier] = node_props
+                    for prop, val in n_data.items():
+                        if prop in node_props:
+                            node.model.set_property(prop, val)
+                    # set custom properties.
+                    for prop, val in n_data.get("custom", {}).items():
+                        node.model.set_property(prop, val)
+                        if isinstance(node, BaseNode):
+                            if node.view.has_widget(prop):
+                                node.view.get_widget(prop).set_value(val)
+
+                    nodes[n_id] = node
+                    self.add_node(node, n_data.get("pos"), push_undo=push_undo)
+
+                    if n_data.get("port_deletion_allowed", None):
+                        node.set_ports(
+                            {
+                                "input_ports": n_data["input_ports"],
+                                "output_ports": n_data["output_ports"],
+                            }
+                        )
+
+            # build the connections.
+            # port dicts are only built once per node and port type, the ports
+            # don't change from here on as "set_ports" has already been called.
+            port_dicts = {}
+
+            def get_ports(node, port_type):
+                key = (node.id, port_type)
+                node_ports = port_dicts.get(key)
+                if node_ports is None:
+                    node_ports = _NODE_PORTS_GETTER[port_type](node)
+                    port_dicts[key] = node_ports
+                return node_ports
+
+            for connection in data.get("connections", []):
+                nid, pname = connection.get("in", ("", ""))
+                in_node = nodes.get(nid) or self.get_node_by_id(nid)
+                if not in_node:
+                    continue
+                in_port = get_ports(in_node, PortTypeEnum.IN.value).get(pname)
+
+                nid, pname = connection.get("out", ("", ""))
+                out_node = nodes.get(nid) or self.get_node_by_id(nid)
+                if not out_node:
+                    continue
+                out_port = get_ports(out_node, PortTypeEnum.OUT.value).get(pname)
+
+                if in_port and out_port:
+                    # only connect if input port is not connected yet or input port
+                    # can have multiple connections.
+                    # important when duplicating nodes.
+                    allow_connection = any(
+                        [
+                            not in_port.model.connected_ports,
+                            in_port.model.multi_connection,
+                        ]
                     )
+                    if allow_connection:
+                        undo_cmd = PortConnectedCmd(
+                            in_port, out_port, emit_signal=False
+                        )
+                        if push_undo:
+                            self._undo_stack.push(undo_cmd)
+                        else:
+                            undo_cmd.redo()
+
+                    # Run on_input_connected to ensure connections are fully set up
+                    # after deserialization.
+                    in_node.on_input_connected(in_port, out_port)
 
-                # Run on_input_connected to ensure connections are fully set up
-                # after deserialization.
-                in_node.on_input_connected(in_port, out_port)
+            if push_undo:
+                self._undo_stack.endMacro()
 
-        node_objs = nodes.values()
-        if relative_pos or pos:
-            move_args = {"pos": pos} if pos else {}
-            self._viewer.move_nodes([n.view for n in node_objs], **move_args)
-            for n in node_objs:
-                n.model.pos = n.view.xy_pos
+            node_objs = nodes.values()
+            if relative_pos or pos:
+                move_args = {"pos": pos} if pos else {}
+                self._viewer.move_nodes([n.view for n in node_objs], **move_args)
+                for n in node_objs:
+                    n.model.pos = n.view.xy_pos
 
         return node_objs
 
@@ -1772,7 +1959,8 @@ class NodeGraph(QtCore.QObject):
         """
         if clear_session:
             self.clear_session()
-        self._deserialize(layout_data)
+        # no need to build undo commands that are about to be cleared.
+        self._deserialize(layout_data, push_undo=not clear_undo_stack)
         self.clear_selection()
         if clear_undo_stack:
             self._undo_stack.clear()
@@ -1793,10 +1981,13 @@ class NodeGraph(QtCore.QObject):
         serialized_data = self.serialize_session()
         file_path = file_path.strip()
 
-        def default(obj):
-            if isinstance(obj, set):
-                return list(obj)
-            return obj
+        if orjson:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            data = orjson.dumps(serialized_data, default=_json_default, option=options)
+            Path(file_path).write_bytes(data)
+            # update the current session.
+            self._model.session = file_path
+            return
 
         with open(file_path, "w", encoding="utf-8") as file_out:
             json.dump(
@@ -1804,7 +1995,7 @@ class NodeGraph(QtCore.QObject):
                 file_out,
                 indent=2,
                 separators=(",", ":"),
-                default=default,
+                default=_json_default,
             )
 
         # update the current session.
@@ -1842,8 +2033,11 @@ class NodeGraph(QtCore.QObject):
             raise IOError(f"file does not exist: {file_path}")
 
         try:
-            with open(file_path, encoding="utf-8") as data_file:
-                layout_data = json.load(data_file)
+            if orjson:
+                layout_data = orjson.loads(Path(file_path).read_bytes())
+            else:
+                with open(file_path, encoding="utf-8") as data_file:
+                    layout_data = json.load(data_file)
         except Exception as e:
             layout_data = None
             print(f"Cannot read data from file.\n{e}")
@@ -1874,9 +2068,22 @@ class NodeGraph(QtCore.QObject):
             return False
         clipboard = QtWidgets.QApplication.clipboard()
         serial_data = self._serialize(nodes)
-        serial_str = json.dumps(serial_data)
-        if serial_str:
-            clipboard.setText(serial_str)
+        if orjson:
+            options = orjson.OPT_NON_STR_KEYS
+            serial_bytes = orjson.dumps(
+                serial_data, default=_json_default, option=options
+            )
+        else:
+            serial_bytes = json.dumps(serial_data, default=_json_default).encode(
+                "utf-8"
+            )
+        if serial_bytes:
+            # the raw utf-8 json is pasted back in this application, the
+            # text copy is for pasting into other applications.
+            mime_data = QtCore.QMimeData()
+            mime_data.setData(_CLIPBOARD_MIME_TYPE, QtCore.QByteArray(serial_bytes))
+            mime_data.setText(serial_bytes.decode("utf-8"))
+            clipboard.setMimeData(mime_data)
             return True
         return False
 
@@ -1897,21 +2104,7 @@ class NodeGraph(QtCore.QObject):
         """
         nodes = nodes or self.selected_nodes()
         self.copy_nodes(nodes)
-        self._undo_stack.beginMacro("cut nodes")
-
-        for node in nodes:
-            if isinstance(node, BaseNode):
-                for p in node.input_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False, push_undo=True)
-                    p.clear_connections()
-                for p in node.output_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False, push_undo=True)
-                    p.clear_connections()
-
-        self._undo_stack.push(NodesRemovedCmd(self, nodes))
-        self._undo_stack.endMacro()
+        self._remove_nodes(nodes, True, True, "cut nodes")
 
     def paste_nodes(self):
         """
@@ -1921,14 +2114,22 @@ class NodeGraph(QtCore.QObject):
             list[NodeGraphQt.BaseNode]: list of pasted node instances.
         """
         clipboard = QtWidgets.QApplication.clipboard()
-        cb_text = clipboard.text()
-        if not cb_text:
-            return
+        mime_data = clipboard.mimeData()
+        if mime_data.hasFormat(_CLIPBOARD_MIME_TYPE):
+            # copied from a node graph, read the utf-8 json bytes directly.
+            cb_data = mime_data.data(_CLIPBOARD_MIME_TYPE).data()
+        else:
+            cb_data = clipboard.text()
+            # copied nodes are always serialized as a json object, skip
+            # parsing any other clipboard text.
+            if not cb_data.lstrip().startswith("{"):
+                return
 
         try:
-            serial_data = json.loads(cb_text)
-        except json.decoder.JSONDecodeError as e:
-            print(f"ERROR: Can't Decode Clipboard Data:\n `{cb_text}`")
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+            serial_data = orjson.loads(cb_data) if orjson else json.loads(cb_data)
+        except json.JSONDecodeError as e:
+            print(f"ERROR: Can't Decode Clipboard Data:\n `{cb_data}`")
             return
 
         self._undo_stack.beginMacro("pasted nodes")
@@ -1956,13 +2157,17 @@ class NodeGraph(QtCore.QObject):
 
         self.clear_selection()
         serial = self._serialize(nodes)
-        new_nodes = self._deserialize(serial)
+        # the graph settings are this graph's own, re-applying them would
+        # only walk every node again for the layout direction.
+        serial.pop("graph", None)
+        # offset the serialized positions so the node added undo commands
+        # record where the duplicates are placed.
         offset = 50
+        for n_data in serial["nodes"].values():
+            x_pos, y_pos = n_data["pos"]
+            n_data["pos"] = [x_pos + offset, y_pos + offset]
+        new_nodes = self._deserialize(serial)
         for n in new_nodes:
-            # TODO: n.x_pos(), n.y_pos() -> n.view.xy_pos
-            # TODO: n.set_pos() -> n.view.set_xy_pos
-            x_pos, y_pos = n.view.xy_pos
-            n.view.set_xy_pos = (x_pos + offset, y_pos + offset)
             n.set_property("selected", True)
 
         self._undo_stack.endMacro()
@@ -1982,34 +2187,28 @@ class NodeGraph(QtCore.QObject):
         if not nodes:
             return
 
-        if len(nodes) == 1:
-            if mode is None:
-                mode = not nodes[0].disabled()
-            nodes[0].set_disabled(mode)
-            return
-
+        # read each node state once for both the undo text and the toggle.
+        states = [n.model.disabled for n in nodes]
         if mode is not None:
-            states = {False: "enable", True: "disable"}
-            text = f"{states[mode]} ({len(nodes)}) nodes"
-            self._undo_stack.beginMacro(text)
-            for n in nodes:
-                n.set_disabled(mode)
-            self._undo_stack.endMacro()
+            text = f"{'disable' if mode else 'enable'} ({len(nodes)}) nodes"
+            new_states = [mode] * len(nodes)
+        else:
+            enabled_count = sum(states)
+            disabled_count = len(states) - enabled_count
+
+            text = []
+            if enabled_count > 0:
+                text.append(f"enabled ({enabled_count})")
+            if disabled_count > 0:
+                text.append(f"disabled ({disabled_count})")
+            text = " / ".join(text) + " nodes"
+            new_states = [not state for state in states]
+
+        undo_cmd = NodesDisabledCmd(list(zip(nodes, new_states, states)))
+        if not undo_cmd.changes:
             return
-
-        text = []
-        enabled_count = len([n for n in nodes if n.disabled()])
-        disabled_count = len([n for n in nodes if not n.disabled()])
-        if enabled_count > 0:
-            text.append(f"enabled ({enabled_count})")
-        if disabled_count > 0:
-            text.append(f"disabled ({disabled_count})")
-        text = " / ".join(text) + " nodes"
-
-        self._undo_stack.beginMacro(text)
-        for n in nodes:
-            n.set_disabled(not n.disabled())
-        self._undo_stack.endMacro()
+        undo_cmd.setText(text)
+        self._undo_stack.push(undo_cmd)
 
     def use_OpenGL(self):
         """
@@ -2021,37 +2220,35 @@ class NodeGraph(QtCore.QObject):
     # --------------------------------------------------------------------------
 
     @staticmethod
-    def _update_node_rank(node, nodes_rank, down_stream=True):
+    def _connected_nodes(node, down_stream=True):
         """
-        Recursive function for updating the node ranking.
+        Returns the nodes connected down stream or up stream of a node.
 
         Args:
-            node (NodeGraphQt.BaseNode): node to start from.
-            nodes_rank (dict): node ranking object to be updated.
-            down_stream (bool): true to rank down stram.
-        """
-        if down_stream:
-            node_values = node.connected_output_nodes().values()
-        else:
-            node_values = node.connected_input_nodes().values()
+            node (NodeGraphQt.BaseNode): node to get the connections from.
+            down_stream (bool): true for the nodes connected to the outputs.
 
-        connected_nodes = set()
-        for nodes in node_values:
-            connected_nodes.update(nodes)
-
-        rank = nodes_rank[node] + 1
-        for n in connected_nodes:
-            if n in nodes_rank:
-                nodes_rank[n] = max(nodes_rank[n], rank)
-            else:
-                nodes_rank[n] = rank
-            NodeGraph._update_node_rank(n, nodes_rank, down_stream)
+        Returns:
+            set[NodeGraphQt.BaseNode]: connected nodes.
+        """
+        # read the connected node ids straight from the port models instead
+        # of resolving every connected port object.
+        ports = node.output_ports() if down_stream else node.input_ports()
+        graph_nodes = node.graph.model.nodes
+        return {
+            graph_nodes[node_id]
+            for port in ports
+            for node_id in port.model.connected_ports
+        }
 
     @staticmethod
     def _compute_node_rank(nodes, down_stream=True):
         """
         Compute the ranking of nodes.
 
+        The rank of a node is the longest path to it from the start nodes, a
+        node is only walked again when its rank has been raised.
+
         Args:
             nodes (list[NodeGraphQt.BaseNode]): nodes to start ranking from.
             down_stream (bool): true to compute down stream.
@@ -2059,10 +2256,26 @@ class NodeGraph(QtCore.QObject):
         Returns:
             dict: {NodeGraphQt.BaseNode: node_rank, ...}
         """
-        nodes_rank = {}
-        for node in nodes:
-            nodes_rank[node] = 0
-            NodeGraph._update_node_rank(node, nodes_rank, down_stream)
+        nodes_rank = dict.fromkeys(nodes, 0)
+        connected = {}
+        queue = deque(nodes_rank)
+        while queue:
+            node = queue.popleft()
+            connected_nodes = connected.get(node)
+            if connected_nodes is None:
+                connected_nodes = NodeGraph._connected_nodes(node, down_stream)
+                connected[node] = connected_nodes
+
+            rank = nodes_rank[node] + 1
+            for n in connected_nodes:
+                if rank <= nodes_rank.get(n, -1):
+                    continue
+                # a path longer than the number of ranked nodes has to go
+                # around a cycle so stop there.
+                if rank >= len(nodes_rank) + (n not in nodes_rank):
+                    continue
+                nodes_rank[n] = rank
+                queue.append(n)
         return nodes_rank
 
     def auto_layout_nodes(self, nodes=None, down_stream=True, start_nodes=None):
@@ -2080,66 +2293,67 @@ class NodeGraph(QtCore.QObject):
             start_nodes (list[NodeGraphQt.BaseNode]):
                 list of nodes to start the auto layout from (Optional).
         """
-        self.begin_undo("Auto Layout Nodes")
-
         nodes = nodes or self.all_nodes()
 
-        start_nodes = start_nodes or []
-        if down_stream:
-            start_nodes += [
-                n for n in nodes if not any(n.connected_input_nodes().values())
-            ]
-        else:
-            start_nodes += [
-                n for n in nodes if not any(n.connected_output_nodes().values())
-            ]
+        # the start nodes have nothing connected up stream, only the port
+        # models need checking rather than resolving the connected nodes.
+        # (dict keeps the order and drops nodes passed in more than once)
+        get_ports = methodcaller("input_ports" if down_stream else "output_ports")
+        start_nodes = dict.fromkeys(start_nodes or ())
+        start_nodes.update(
+            dict.fromkeys(
+                n
+                for n in nodes
+                if not any(p.model.connected_ports for p in get_ports(n))
+            )
+        )
 
         if not start_nodes:
             return
 
+        self.begin_undo("Auto Layout Nodes")
+
         node_views = [n.view for n in nodes]
         nodes_center_0 = self.viewer().nodes_rect_center(node_views)
 
-        nodes_rank = NodeGraph._compute_node_rank(start_nodes, down_stream)
+        nodes_rank = NodeGraph._compute_node_rank(list(start_nodes), down_stream)
 
-        rank_map = {}
+        rank_map = defaultdict(list)
         for node, rank in nodes_rank.items():
-            if rank in rank_map:
-                rank_map[rank].append(node)
-            else:
-                rank_map[rank] = [node]
+            rank_map[rank].append(node)
 
         node_layout_direction = self._viewer.get_layout_direction()
 
-        if node_layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        ranks = sorted(range(len(rank_map)), reverse=not down_stream)
+        if node_layout_direction == LayoutDirectionEnum.HORIZONTAL.value:
             current_x = 0
             node_height = 120
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_width = max([node.view.width for node in ranked_nodes])
+            for rank in ranks:
+                ranked_views = [node.view for node in rank_map[rank]]
+                max_width = max(view.width for view in ranked_views)
                 current_x += max_width
                 current_y = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dy = max(node_height, node.view.height)
+                for idx, view in enumerate(ranked_views):
+                    dy = max(node_height, view.height)
                     current_y += 0 if idx == 0 else dy
                     # TODO: self.set_pos() -> self.view.xy_pos
-                    node.view.xy_pos = (current_x, current_y)
+                    view.xy_pos = (current_x, current_y)
                     current_y += dy * 0.5 + 10
 
                 current_x += max_width * 0.3
-        elif node_layout_direction is LayoutDirectionEnum.VERTICAL.value:
+        elif node_layout_direction == LayoutDirectionEnum.VERTICAL.value:
             current_y = 0
             node_width = 250
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_height = max([node.view.height for node in ranked_nodes])
+            for rank in ranks:
+                ranked_views = [node.view for node in rank_map[rank]]
+                max_height = max(view.height for view in ranked_views)
                 current_y += max_height
                 current_x = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dx = max(node_width, node.view.width)
+                for idx, view in enumerate(ranked_views):
+                    dx = max(node_width, view.width)
                     current_x += 0 if idx == 0 else dx
                     # TODO: self.set_pos() -> self.view.xy_pos
-                    node.view.xy_pos = (current_x, current_y)
+                    view.xy_pos = (current_x, current_y)
                     current_x += dx * 0.5 + 10
 
                 current_y += max_height * 0.3
@@ -2148,11 +2362,9 @@ class NodeGraph(QtCore.QObject):
         dx = nodes_center_0[0] - nodes_center_1[0]
         dy = nodes_center_0[1] - nodes_center_1[1]
 
-        for n in nodes:
-            # TODO: n.x_pos(), n.y_pos() -> n.view.xy_pos
-            # TODO: self.set_pos() -> self.view.xy_pos
-            x_pos, y_pos = n.view.xy_pos
-            n.view.xy_pos = (x_pos + dx, y_pos + dy)
+        # offset in place rather than reading back and setting each position.
+        for view in node_views:
+            view.moveBy(dx, dy)
 
         self.end_undo()
 
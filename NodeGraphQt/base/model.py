@@ -4,6 +4,23 @@ from NodeGraphQt.constants import (
 )
 
 
+def _constraint_sets(data):
+    """
+    Returns a copy of the nested connection constrains data with the port
+    name lists (read back from a serialized session) converted to sets.
+
+    Args:
+        data (dict): nested connection constrains data.
+
+    Returns:
+        dict: connection constrains data.
+    """
+    return {
+        k: _constraint_sets(v) if isinstance(v, dict) else set(v)
+        for k, v in data.items()
+    }
+
+
 class NodeGraphModel:
     """
     Data dump for a node graph.
@@ -16,6 +33,9 @@ class NodeGraphModel:
         self.reject_connection_types = {}
 
         self.nodes = {}
+        # lookup tables kept in sync with the "nodes" dict.
+        self.nodes_by_name = {}
+        self.nodes_by_type = {}
         self.session = ""
         self.acyclic = True
         self.pipe_collision = False
@@ -85,3 +105,72 @@ class NodeGraphModel:
             dict: node common properties.
         """
         return self.__common_node_props.get(node_type)
+
+    def set_accept_connection_types(self, data):
+        """
+        Replace the accept connection constrains in place, the viewer keeps
+        a reference to the same dict.
+
+        Args:
+            data (dict): serialized accept connection constrains.
+        """
+        data = _constraint_sets(data)
+        self.accept_connection_types.clear()
+        self.accept_connection_types.update(data)
+
+    def set_reject_connection_types(self, data):
+        """
+        Replace the reject connection constrains in place.
+
+        Args:
+            data (dict): serialized reject connection constrains.
+        """
+        data = _constraint_sets(data)
+        self.reject_connection_types.clear()
+        self.reject_connection_types.update(data)
+
+    def add_node(self, node):
+        """
+        Store the node and register it in the node lookup tables.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+        """
+        self.nodes[node.id] = node
+        self.nodes_by_name[node.view.name] = node
+        self.nodes_by_type.setdefault(node.dtype(), {})[node.id] = node
+
+    def remove_node(self, node_id):
+        """
+        Remove the node and unregister it from the node lookup tables.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            NodeGraphQt.NodeObject: removed node object.
+        """
+        node = self.nodes.pop(node_id)
+        if self.nodes_by_name.get(node.view.name) is node:
+            del self.nodes_by_name[node.view.name]
+        type_nodes = self.nodes_by_type.get(node.dtype())
+        if type_nodes is not None:
+            type_nodes.pop(node_id, None)
+            if not type_nodes:
+                del self.nodes_by_type[node.dtype()]
+        return node
+
+    def rename_node(self, node, old_name, new_name):
+        """
+        Update the node name lookup table after a node has been renamed.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+            old_name (str): previous node name.
+            new_name (str): new node name.
+        """
+        if node.id not in self.nodes:
+            return
+        if self.nodes_by_name.get(old_name) is node:
+            del self.nodes_by_name[old_name]
+        self.nodes_by_name[new_name] = node
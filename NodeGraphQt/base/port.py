@@ -1,4 +1,4 @@
-from typing import List, DefaultDict
+from typing import DefaultDict, Dict
 from collections import defaultdict
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -29,8 +29,10 @@ class PortModel(BaseModel):
     multi_connection: bool = False
     visible: bool = True
     locked: bool = False
-    connected_ports: DefaultDict[str, List[str]] = Field(
-        default_factory=lambda: defaultdict(list)
+    # connected port names per node id, the port names are kept as
+    # insertion ordered dict keys so the connections order is deterministic.
+    connected_ports: DefaultDict[str, Dict[str, None]] = Field(
+        default_factory=lambda: defaultdict(dict)
     )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -762,28 +762,13 @@ class BaseNode(NodeObject):
             accept_ptype (str): port type accept.
             accept_ntype (str):port node type to accept.
         """
-        port_name = port.name
-        port_type = port.dtype
-        node_type = self.dtype()
-
-        node_ports = self._inputs + self._outputs
-        if port not in node_ports:
-            raise PortError(f"Node does not contain port: '{port}'")
-
-        connection_data = self._model._graph_model.accept_connection_types
-        keys = [node_type, port_type, port_name, accept_ntype]
-        for key in keys:
-            if key not in connection_data:
-                connection_data[key] = {}
-            connection_data = connection_data[key]
-
-        if accept_ptype not in connection_data:
-            connection_data[accept_ptype] = set([accept_pname])
-        else:
-            # ensure data remains a set instead of list after json de-serialize
-            connection_data[accept_ptype] = set(connection_data[accept_ptype]) | {
-                accept_pname
-            }
+        self._add_port_type_constrain(
+            self._model._graph_model.accept_connection_types,
+            port,
+            accept_pname,
+            accept_ptype,
+            accept_ntype,
+        )
 
     def add_reject_port_type(self, port, reject_pname, reject_ptype, reject_ntype):
         """
@@ -795,28 +780,37 @@ class BaseNode(NodeObject):
             reject_ptype (str): port type to reject.
             reject_ntype (str): port node type to reject.
         """
-        port_name = port.name
-        port_type = port.dtype
-        node_type = self.dtype()
+        self._add_port_type_constrain(
+            self._model._graph_model.reject_connection_types,
+            port,
+            reject_pname,
+            reject_ptype,
+            reject_ntype,
+        )
 
-        node_ports = self._inputs + self._outputs
-        if port not in node_ports:
+    def _add_port_type_constrain(self, connection_data, port, pname, ptype, ntype):
+        """
+        Add a port name to the accept or reject connection constrains.
+        (used internally by the node)
+
+        Args:
+            connection_data (dict): accept or reject connection constrains.
+            port (NodeGraphQt.Port): port to assign constrain to.
+            pname (str): constrained port name.
+            ptype (str): constrained port type.
+            ntype (str): constrained port node type.
+        """
+        if port not in self._inputs and port not in self._outputs:
             raise PortError(f"Node does not contain port: '{port}'")
 
-        connection_data = self._model._graph_model.reject_connection_types
-        keys = [node_type, port_type, port_name, reject_ntype]
-        for key in keys:
-            if key not in connection_data:
-                connection_data[key] = {}
-            connection_data = connection_data[key]
+        for key in (self.dtype(), port.dtype, port.name, ntype):
+            connection_data = connection_data.setdefault(key, {})
 
-        if reject_ptype not in connection_data:
-            connection_data[reject_ptype] = set([reject_pname])
-        else:
-            # ensure data remains a set instead of list after json de-serialize
-            connection_data[reject_ptype] = set(connection_data[reject_ptype]) | {
-                reject_pname
-            }
+        port_names = connection_data.setdefault(ptype, set())
+        if not isinstance(port_names, set):
+            # data assigned directly from a json de-serialize is a list.
+            port_names = connection_data[ptype] = set(port_names)
+        port_names.add(pname)
 
     def on_input_connected(self, in_port, out_port):
         """
@@ -1,3 +1,5 @@
+from functools import partial
+
 from PySide6 import QtCore, QtWidgets
 
 from NodeGraphQt.constants import (
@@ -34,6 +36,8 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         }
         self._width = NodeEnum.WIDTH.value
         self._height = NodeEnum.HEIGHT.value
+        self._prop_dispatch = None
+        self._property_names = None
 
     def __repr__(self):
         return f"{self.__module__}.{self.__class__.__name__}('{self.name}')"
@@ -197,6 +201,20 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
     def name(self, name=""):
         self._properties["name"] = name
 
+    @property
+    def property_names(self):
+        """
+        return the node view attribute names.
+
+        Returns:
+            frozenset[str]: property names.
+        """
+        if self._property_names is None:
+            self._property_names = frozenset(
+                list(self._properties.keys()) + ["width", "height", "pos"]
+            )
+        return self._property_names
+
     @property
     def properties(self):
         """
@@ -209,6 +227,38 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         props.update(self._properties)
         return props
 
+    def _build_prop_dispatch(self):
+        """
+        Build the mapping of node property names to the functions that
+        update the node view attributes.
+
+        Returns:
+            dict: {property_name: setter_function}
+        """
+        dispatch = {
+            name: partial(setattr, self, name)
+            for name in list(self._properties.keys()) + ["width", "height"]
+        }
+        # "node.pos" conflicted with "QGraphicsItem.pos()"
+        # so it's refactored to "xy_pos".
+        dispatch["pos"] = partial(setattr, self, "xy_pos")
+        return dispatch
+
+    def get_property_setter(self, name):
+        """
+        Returns the function used to update the node view from a node
+        property. (the dispatch table is built the first time it's used.)
+
+        Args:
+            name (str): node property name.
+
+        Returns:
+            function: setter function or None if not a view property.
+        """
+        if self._prop_dispatch is None:
+            self._prop_dispatch = self._build_prop_dispatch()
+        return self._prop_dispatch.get(name)
+
     def viewer(self):
         """
         return the main viewer.
@@ -233,7 +283,7 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         Args:
             node_dict (dict): serialized node dict.
         """
-        node_attrs = list(self._properties.keys()) + ["width", "height", "pos"]
+        node_attrs = self.property_names
         for name, value in node_dict.items():
             if name in node_attrs:
                 # "node.pos" conflicted with "QGraphicsItem.pos()"
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from functools import partial
 
 from PySide6 import QtGui, QtCore, QtWidgets
 
@@ -16,6 +17,20 @@ from NodeGraphQt.qgraphics.node_text_item import NodeTextItem
 from NodeGraphQt.qgraphics.port import PortItem, CustomPortItem
 
 
+def _set_widget_value(widget, value):
+    """
+    Set the node widget value.
+
+    Args:
+        widget (NodeBaseWidget): embedded node widget.
+        value (object): property value.
+    """
+    # check if previous value is identical to current value,
+    # prevent signals from causing an infinite loop.
+    if widget.get_value() != value:
+        widget.set_value(value)
+
+
 class NodeItem(AbstractNodeItem):
     """
     Base Node item.
@@ -31,6 +46,7 @@ class NodeItem(AbstractNodeItem):
         self._input_items = OrderedDict()
         self._output_items = OrderedDict()
         self._widgets = OrderedDict()
+        self._widget_names = frozenset()
 
     def _paint_horizontal(self, painter, option, widget):
         painter.save()
@@ -121,9 +137,9 @@ class NodeItem(AbstractNodeItem):
             widget (QtWidgets.QWidget): not used.
         """
         # self.auto_switch_mode()  # TODO: Deprecated for simplefy
-        if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        if self.layout_direction == LayoutDirectionEnum.HORIZONTAL.value:
             self._paint_horizontal(painter, option, widget)
-        elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
+        elif self.layout_direction == LayoutDirectionEnum.VERTICAL.value:
             self._paint_vertical(painter, option, widget)
         else:
             raise RuntimeError("Node graph layout direction not valid!")
@@ -371,9 +387,9 @@ class NodeItem(AbstractNodeItem):
         Returns:
             tuple(float, float): width, height.
         """
-        if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        if self.layout_direction == LayoutDirectionEnum.HORIZONTAL.value:
             width, height = self._calc_size_horizontal()
-        elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
+        elif self.layout_direction == LayoutDirectionEnum.VERTICAL.value:
             width, height = self._calc_size_vertical()
         else:
             raise RuntimeError("Node graph layout direction not valid!")
@@ -405,9 +421,9 @@ class NodeItem(AbstractNodeItem):
             v_offset (float): vertical offset.
             h_offset (float): horizontal offset.
         """
-        if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        if self.layout_direction == LayoutDirectionEnum.HORIZONTAL.value:
             self._align_label_horizontal(h_offset, v_offset)
-        elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
+        elif self.layout_direction == LayoutDirectionEnum.VERTICAL.value:
             self._align_label_vertical(h_offset, v_offset)
         else:
             raise RuntimeError("Node graph layout direction not valid!")
@@ -463,9 +479,9 @@ class NodeItem(AbstractNodeItem):
         Args:
             v_offset (float): vertical offset.
         """
-        if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        if self.layout_direction == LayoutDirectionEnum.HORIZONTAL.value:
             self._align_widgets_horizontal(v_offset)
-        elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
+        elif self.layout_direction == LayoutDirectionEnum.VERTICAL.value:
             self._align_widgets_vertical(v_offset)
         else:
             raise RuntimeError("Node graph layout direction not valid!")
@@ -533,9 +549,9 @@ class NodeItem(AbstractNodeItem):
         Args:
             v_offset (float): port vertical offset.
         """
-        if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        if self.layout_direction == LayoutDirectionEnum.HORIZONTAL.value:
             self._align_ports_horizontal(v_offset)
-        elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
+        elif self.layout_direction == LayoutDirectionEnum.VERTICAL.value:
             self._align_ports_vertical(v_offset)
         else:
             raise RuntimeError("Node graph layout direction not valid!")
@@ -601,9 +617,9 @@ class NodeItem(AbstractNodeItem):
         Re-draw the node item in the scene with proper
         calculated size and widgets aligned.
         """
-        if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
+        if self.layout_direction == LayoutDirectionEnum.HORIZONTAL.value:
             self._draw_node_horizontal()
-        elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
+        elif self.layout_direction == LayoutDirectionEnum.VERTICAL.value:
             self._draw_node_vertical()
         else:
             raise RuntimeError("Node graph layout direction not valid!")
@@ -817,8 +833,19 @@ class NodeItem(AbstractNodeItem):
     def widgets(self):
         return self._widgets.copy()
 
+    @property
+    def widget_names(self):
+        """
+        Returns:
+            frozenset[str]: names of the embedded node widgets.
+        """
+        return self._widget_names
+
     def add_widget(self, widget):
         self._widgets[widget.get_name()] = widget
+        self._widget_names = frozenset(self._widgets)
+        # rebuild the property dispatch table with the new widget.
+        self._prop_dispatch = None
 
     def get_widget(self, name):
         widget = self._widgets.get(name)
@@ -827,7 +854,19 @@ class NodeItem(AbstractNodeItem):
         raise NodeWidgetError('node has no widget "{}"'.format(name))
 
     def has_widget(self, name):
-        return name in self._widgets.keys()
+        return name in self._widget_names
+
+    def _build_prop_dispatch(self):
+        """
+        Re-implemented to also update the embedded node widgets.
+
+        Returns:
+            dict: {property_name: setter_function}
+        """
+        dispatch = super()._build_prop_dispatch()
+        for name, widget in self._widgets.items():
+            dispatch[name] = partial(_set_widget_value, widget)
+        return dispatch
 
     def from_dict(self, node_dict):
         super().from_dict(node_dict)
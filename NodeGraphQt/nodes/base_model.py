@@ -1,4 +1,6 @@
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, get_origin
+from functools import lru_cache
+from types import MappingProxyType
 from uuid import uuid4
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -10,6 +12,76 @@ from NodeGraphQt.errors import NodePropertyError
 from NodeGraphQt.nodes.base_item import NodeItem
 from NodeGraphQt.base.model import NodeGraphModel
 
+# "NodeModel.properties" entries built from the port models and the custom
+# properties instead of being read from a model field.
+_PORT_DATA_PROPERTIES = frozenset(
+    {"inputs", "outputs", "input_ports", "output_ports", "custom"}
+)
+
+
+# widget type used when a custom property is added without one.
+_HIDDEN_WIDGET_TYPE = NodePropWidgetEnum.HIDDEN.value
+
+# widget types of the default node properties, shared by all the node models
+# until a custom property is added.
+_DEFAULT_WIDGET_TYPES = MappingProxyType(
+    {
+        "dtype": NodePropWidgetEnum.QLABEL.value,
+        "id": NodePropWidgetEnum.QLABEL.value,
+        "name": NodePropWidgetEnum.QLINE_EDIT.value,
+        "border_color": NodePropWidgetEnum.COLOR_PICKER.value,
+        "text_color": NodePropWidgetEnum.COLOR_PICKER.value,
+        "disabled": NodePropWidgetEnum.QCHECK_BOX.value,
+        "selected": NodePropWidgetEnum.HIDDEN.value,
+        "width": NodePropWidgetEnum.HIDDEN.value,
+        "height": NodePropWidgetEnum.HIDDEN.value,
+        "pos": NodePropWidgetEnum.HIDDEN.value,
+        "layout_direction": NodePropWidgetEnum.HIDDEN.value,
+        "inputs": NodePropWidgetEnum.HIDDEN.value,
+        "outputs": NodePropWidgetEnum.HIDDEN.value,
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _node_type(node_cls):
+    """
+    Returns the node type identifier of a node class, only built once per
+    class.
+
+    Args:
+        node_cls (type): node class.
+
+    Returns:
+        str: node type (``__identifier__.__className__``)
+    """
+    return node_cls.__identifier__ + "." + node_cls.__name__
+
+
+# NOTE: port_dict: Dict[str, PortModel]
+def _connected_ports(port_dict):
+    # the port models keep the connected port names as ordered dict keys,
+    # they're exposed as lists.
+    return {
+        name: {
+            node_id: list(port_names)
+            for node_id, port_names in model.connected_ports.items()
+        }
+        for name, model in port_dict.items()
+    }
+
+
+# NOTE: port_dict: Dict[str, PortModel]
+def _ports_data(port_dict):
+    return [
+        {
+            "name": name,
+            "multi_connection": model.multi_connection,
+            "display_name": model.display_name,
+        }
+        for name, model in port_dict.items()
+    ]
+
 
 class NodeModel(BaseModel):
     """
@@ -44,26 +116,14 @@ class NodeModel(BaseModel):
     _graph_model: Optional[NodeGraphModel] = None
 
     # store the property attributes.
-    # (deleted when node is added to the graph)
-    _property_attrs: Dict = {}
+    # (allocated on the first custom property, deleted when node is added to
+    # the graph)
+    _property_attrs: Optional[Dict] = None
 
     # temp store the property widget types.
-    # (deleted when node is added to the graph)
-    _property_widget_types: Dict = {
-        "dtype": NodePropWidgetEnum.QLABEL.value,
-        "id": NodePropWidgetEnum.QLABEL.value,
-        "name": NodePropWidgetEnum.QLINE_EDIT.value,
-        "border_color": NodePropWidgetEnum.COLOR_PICKER.value,
-        "text_color": NodePropWidgetEnum.COLOR_PICKER.value,
-        "disabled": NodePropWidgetEnum.QCHECK_BOX.value,
-        "selected": NodePropWidgetEnum.HIDDEN.value,
-        "width": NodePropWidgetEnum.HIDDEN.value,
-        "height": NodePropWidgetEnum.HIDDEN.value,
-        "pos": NodePropWidgetEnum.HIDDEN.value,
-        "layout_direction": NodePropWidgetEnum.HIDDEN.value,
-        "inputs": NodePropWidgetEnum.HIDDEN.value,
-        "outputs": NodePropWidgetEnum.HIDDEN.value,
-    }
+    # (allocated on the first custom property from the class defaults,
+    # deleted when node is added to the graph)
+    _property_widget_types: Optional[Dict] = None
 
     def __repr__(self):
         msg = f"{self.__class__.__name__}('{self.name}')"
@@ -94,10 +154,10 @@ class NodeModel(BaseModel):
             widget_tooltip (str): custom tooltip for the property widget.
             tab (str): widget tab name.
         """
-        widget_type = widget_type or NodePropWidgetEnum.HIDDEN.value
+        widget_type = widget_type or _HIDDEN_WIDGET_TYPE
         tab = tab or "Properties"
 
-        if name in self.properties:
+        if self.is_default_property(name):
             raise NodePropertyError(f"'{name}' reserved for default property.")
         if name in self._custom_prop:
             raise NodePropertyError(f"'{name}' property already exists.")
@@ -105,6 +165,9 @@ class NodeModel(BaseModel):
         self._custom_prop[name] = value
 
         if self._graph_model is None:
+            if self._property_widget_types is None:
+                self._property_widget_types = dict(_DEFAULT_WIDGET_TYPES)
+                self._property_attrs = {}
             self._property_widget_types[name] = widget_type
             self._property_attrs[name] = {"tab": tab}
             if items:
@@ -130,8 +193,16 @@ class NodeModel(BaseModel):
             name (str): property name.
             value (object): property value.
         """
-        if name in self.properties:
-            self.properties[name] = value
+        if name in _PORT_DATA_PROPERTIES:
+            # derived from the port models and custom properties.
+            return
+        if name in type(self).model_fields:
+            # json (de)serialized sequences are lists, store them as the
+            # field type so the model serializer doesn't warn about them.
+            field_type = _SEQUENCE_FIELD_TYPES.get(name)
+            if field_type is not None and not isinstance(value, field_type):
+                value = field_type(value)
+            setattr(self, name, value)
         elif name in self._custom_prop:
             self._custom_prop[name] = value
         else:
@@ -145,10 +216,33 @@ class NodeModel(BaseModel):
         Returns:
             object: property value.
         """
-        if name in self.properties:
-            return self.properties[name]
+        if name in _PORT_DATA_PROPERTIES:
+            return self._port_data_property(name)
+        if name in type(self).model_fields:
+            return getattr(self, name)
         return self._custom_prop.get(name)
 
+    @classmethod
+    def property_names(cls):
+        """
+        Returns the names of the default node properties without building
+        the :attr:`NodeModel.properties` dict.
+
+        Returns:
+            frozenset[str]: default property names.
+        """
+        return frozenset(cls.model_fields).union(_PORT_DATA_PROPERTIES)
+
+    def is_default_property(self, name):
+        """
+        Args:
+            name (str): property name.
+
+        Returns:
+            bool: true if default node property.
+        """
+        return name in type(self).model_fields or name in _PORT_DATA_PROPERTIES
+
     def is_custom_property(self, name):
         """
         Args:
@@ -170,7 +264,7 @@ class NodeModel(BaseModel):
         model = self._graph_model
 
         if model is None:
-            return self._property_widget_types.get(name)
+            return self.property_widget_types.get(name)
         return model.get_node_common_properties(self.dtype)[name]["widget_type"]
 
     def get_tab_name(self, name):
@@ -183,12 +277,63 @@ class NodeModel(BaseModel):
         """
         model = self._graph_model
         if model is None:
-            attrs = self._property_attrs.get(name)
+            attrs = self.property_attrs.get(name)
             if attrs:
-                return attrs[name].get("tab")
+                return attrs.get("tab")
             return
         return model.get_node_common_properties(self.dtype)[name]["tab"]
 
+    @property
+    def property_widget_types(self):
+        """
+        Returns the property widget types stored before the node is added to
+        the graph.
+
+        Returns:
+            Mapping[str, int]: property widget types.
+        """
+        if self._property_widget_types is None:
+            return _DEFAULT_WIDGET_TYPES
+        return self._property_widget_types
+
+    @property
+    def property_attrs(self):
+        """
+        Returns the property attributes stored before the node is added to
+        the graph.
+
+        Returns:
+            Mapping[str, dict]: property attributes.
+        """
+        if self._property_attrs is None:
+            return {}
+        return self._property_attrs
+
+    def _port_data_property(self, name):
+        """
+        Build a single port data entry of the :attr:`NodeModel.properties`
+        dict.
+
+        Args:
+            name (str): port data property name.
+
+        Returns:
+            object: property value.
+        """
+        if name == "custom":
+            return self._custom_prop
+        if name == "inputs":
+            return _connected_ports(self.inputs)
+        if name == "outputs":
+            return _connected_ports(self.outputs)
+        # port data is only needed to rebuild the ports of nodes that allow
+        # port deletion.
+        if not self.port_deletion_allowed:
+            return []
+        if name == "input_ports":
+            return _ports_data(self.inputs)
+        return _ports_data(self.outputs)
+
     @property
     def properties(self):
         """
@@ -198,28 +343,8 @@ class NodeModel(BaseModel):
             dict: default node properties.
         """
         node_dict = self.model_dump(exclude={"inputs", "outputs"})
-
-        # NOTE: port_dict: Dict[str, PortModel]
-        def _get_connected_ports(port_dict):
-            return {name: model.connected_ports for name, model in port_dict.items()}
-
-        # NOTE: port_dict: Dict[str, PortModel]
-        def _get_ports(port_dict):
-            return [
-                {
-                    "name": name,
-                    "multi_connection": model.multi_connection,
-                    "display_name": model.display_name,
-                }
-                for name, model in port_dict.items()
-                if self.port_deletion_allowed
-            ]
-
-        node_dict["inputs"] = _get_connected_ports(self.inputs)
-        node_dict["outputs"] = _get_connected_ports(self.inputs)
-        node_dict["input_ports"] = _get_ports(self.inputs)
-        node_dict["output_ports"] = _get_ports(self.outputs)
-        node_dict["custom"] = self._custom_prop
+        for name in ("inputs", "outputs", "input_ports", "output_ports", "custom"):
+            node_dict[name] = self._port_data_property(name)
 
         return node_dict
 
@@ -234,6 +359,14 @@ class NodeModel(BaseModel):
         return self._custom_prop
 
 
+# sequence type of the "NodeModel" tuple and list fields.
+_SEQUENCE_FIELD_TYPES = {
+    name: get_origin(field.annotation)
+    for name, field in NodeModel.model_fields.items()
+    if get_origin(field.annotation) in (tuple, list)
+}
+
+
 class NodeObject:
     """
     The ``NodeGraphQt.NodeObject`` class is the main base class that all
@@ -325,7 +458,7 @@ class NodeObject:
         # `<property object at 0x000001CA6D70B7E0>` already registered
         # to `<class 'NodeGraphQt.nodes.backdrop_node.BackdropNode'>`!
         # Please specify a new plugin class name or __identifier__.
-        return cls.__identifier__ + "." + cls.__name__
+        return _node_type(cls)
 
     @property
     def id(self):
@@ -339,11 +339,11 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
 
         if end_port and not self.viewer().acyclic:
             if end_port.node == start_port.node:
-                if direction is LayoutDirectionEnum.VERTICAL.value:
+                if direction == LayoutDirectionEnum.VERTICAL.value:
                     self._draw_path_cycled_vertical(start_port, pos1, pos2, path)
                     self._draw_direction_pointer()
                     return
-                elif direction is LayoutDirectionEnum.HORIZONTAL.value:
+                elif direction == LayoutDirectionEnum.HORIZONTAL.value:
                     self._draw_path_cycled_horizontal(start_port, pos1, pos2, path)
                     self._draw_direction_pointer()
                     return
@@ -356,9 +356,9 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             self._draw_direction_pointer()
             return
 
-        if direction is LayoutDirectionEnum.VERTICAL.value:
+        if direction == LayoutDirectionEnum.VERTICAL.value:
             self._draw_path_vertical(start_port, pos1, pos2, path)
-        elif direction is LayoutDirectionEnum.HORIZONTAL.value:
+        elif direction == LayoutDirectionEnum.HORIZONTAL.value:
             self._draw_path_horizontal(start_port, pos1, pos2, path)
 
         self._draw_direction_pointer()
@@ -608,14 +608,14 @@ class LivePipeItem(PipeItem):
 
         transform = QtGui.QTransform()
         transform.translate(cursor_pos.x(), cursor_pos.y())
-        if self.viewer_layout_direction() is LayoutDirectionEnum.VERTICAL.value:
+        if self.viewer_layout_direction() == LayoutDirectionEnum.VERTICAL.value:
             text_pos = (
                 cursor_pos.x() + (text_rect.width() / 2.5),
                 cursor_pos.y() - (text_rect.height() / 2),
             )
             if start_port.port_type == PortTypeEnum.OUT.value:
                 transform.rotate(180)
-        elif self.viewer_layout_direction() is LayoutDirectionEnum.HORIZONTAL.value:
+        elif self.viewer_layout_direction() == LayoutDirectionEnum.HORIZONTAL.value:
             text_pos = (
                 cursor_pos.x() - (text_rect.width() / 2),
                 cursor_pos.y() - (text_rect.height() * 1.25),
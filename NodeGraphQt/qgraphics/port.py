@@ -2,6 +2,12 @@ from PySide6 import QtGui, QtCore, QtWidgets
 
 from NodeGraphQt.constants import PortTypeEnum, PortEnum, Z_VAL_PORT, ITEM_CACHE_MODE
 
+# port type -> pipe attribute holding the port on the other end of the pipe.
+_CONNECTED_PIPE_PORT = {
+    PortTypeEnum.IN.value: "output_port",
+    PortTypeEnum.OUT.value: "input_port",
+}
+
 
 class PortItem(QtWidgets.QGraphicsItem):
     """
@@ -152,14 +158,8 @@ class PortItem(QtWidgets.QGraphicsItem):
 
     @property
     def connected_ports(self):
-        ports = []
-        port_types = {
-            PortTypeEnum.IN.value: "output_port",
-            PortTypeEnum.OUT.value: "input_port",
-        }
-        for pipe in self.connected_pipes:
-            ports.append(getattr(pipe, port_types[self.port_type]))
-        return ports
+        port_attr = _CONNECTED_PIPE_PORT[self.port_type]
+        return [getattr(pipe, port_attr) for pipe in self.connected_pipes]
 
     @property
     def hovered(self):
@@ -258,12 +258,9 @@ class PortItem(QtWidgets.QGraphicsItem):
         self.update()
 
     def disconnect_from(self, port):
-        port_types = {
-            PortTypeEnum.IN.value: "output_port",
-            PortTypeEnum.OUT.value: "input_port",
-        }
+        port_attr = _CONNECTED_PIPE_PORT[self.port_type]
         for pipe in self.connected_pipes:
-            connected_port = getattr(pipe, port_types[self.port_type])
+            connected_port = getattr(pipe, port_attr)
             if connected_port == port:
                 pipe.delete()
                 break
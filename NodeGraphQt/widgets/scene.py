@@ -98,11 +98,11 @@ class NodeScene(QtWidgets.QGraphicsScene):
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
         painter.setBrush(self.backgroundBrush())
 
-        if self._grid_mode is ViewerEnum.GRID_DISPLAY_DOTS.value:
+        if self._grid_mode == ViewerEnum.GRID_DISPLAY_DOTS.value:
             pen = QtGui.QPen(QtGui.QColor(*self.grid_color), 0.65)
             self._draw_dots(painter, rect, pen, ViewerEnum.GRID_SIZE.value)
 
-        elif self._grid_mode is ViewerEnum.GRID_DISPLAY_LINES.value:
+        elif self._grid_mode == ViewerEnum.GRID_DISPLAY_LINES.value:
             zoom = self.viewer().get_zoom()
             if zoom > -0.5:
                 pen = QtGui.QPen(QtGui.QColor(*self.grid_color), 0.65)
@@ -1572,6 +1572,15 @@ class NodeViewer(QtWidgets.QGraphicsView):
             self._scene_range.height(),
         ]
 
+    def visible_scene_rect(self):
+        """
+        Returns the area of the scene currently visible in the viewport.
+
+        Returns:
+            QtCore.QRectF: visible scene rect.
+        """
+        return self.mapToScene(self.viewport().rect()).boundingRect()
+
     def set_scene_rect(self, rect):
         """
         Sets the scene rect and redraws the scene.
@@ -0,0 +1,204 @@
+import json
+import os
+import warnings
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from NodeGraphQt.base.graph import NodeGraph
+from NodeGraphQt.nodes.base import BaseNode
+from NodeGraphQt.constants import PortTypeEnum
+
+
+class FooNode(BaseNode):
+
+    __identifier__ = "nodeGraphQt.tests"
+
+    NODE_NAME = "Foo Node"
+
+    def __init__(self):
+        super(FooNode, self).__init__()
+        self.add_input("in")
+        self.add_output("out")
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def graph(qapp):
+    node_graph = NodeGraph()
+    node_graph.register_node(FooNode)
+    return node_graph
+
+
+def test_copy_nodes_with_port_constraints(graph):
+    node = graph.create_node(FooNode.dtype(), push_undo=False)
+    node.add_accept_port_type(
+        node.input(0), "out", PortTypeEnum.OUT.value, FooNode.dtype()
+    )
+
+    assert graph.copy_nodes([node])
+
+    copied = json.loads(QtWidgets.QApplication.clipboard().text())
+    node_type = FooNode.dtype()
+    accepted = copied["graph"]["accept_connection_types"]
+    port_data = accepted[node_type][PortTypeEnum.IN.value]["in"][node_type]
+    assert port_data == {PortTypeEnum.OUT.value: ["out"]}
+
+    pasted = graph.paste_nodes()
+    assert len(pasted) == 1
+
+
+def test_duplicate_nodes_offset_and_graph_settings(graph, monkeypatch):
+    node = graph.create_node(FooNode.dtype(), pos=(10, 20), push_undo=False)
+
+    def set_layout_direction(direction):
+        raise AssertionError("duplicate_nodes re-applied the graph settings.")
+
+    monkeypatch.setattr(graph, "set_layout_direction", set_layout_direction)
+    acyclic = graph.acyclic()
+    pipe_style = graph.pipe_style()
+
+    (duplicate,) = graph.duplicate_nodes([node])
+    assert list(duplicate.view.xy_pos) == [60.0, 70.0]
+    assert list(duplicate.model.pos) == [60.0, 70.0]
+    assert list(node.view.xy_pos) == [10.0, 20.0]
+    assert graph.acyclic() == acyclic
+    assert graph.pipe_style() == pipe_style
+
+    # the duplicate is restored at the offset position.
+    undo_stack = graph.undo_stack()
+    undo_stack.undo()
+    undo_stack.redo()
+    assert list(duplicate.view.xy_pos) == [60.0, 70.0]
+
+
+def test_connect_ports_undo_redo(graph):
+    node_a = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_b = graph.create_node(FooNode.dtype(), push_undo=False)
+    out_port, in_port = node_a.output(0), node_b.input(0)
+
+    out_port.connect_to(in_port)
+    assert in_port.connected_ports() == [out_port]
+
+    undo_stack = graph.undo_stack()
+    undo_stack.undo()
+    assert in_port.connected_ports() == []
+    assert out_port.connected_ports() == []
+
+    undo_stack.redo()
+    assert in_port.connected_ports() == [out_port]
+    assert out_port.connected_ports() == [in_port]
+
+
+def test_disable_nodes_undo_redo(graph):
+    nodes = [graph.create_node(FooNode.dtype(), push_undo=False) for _ in range(2)]
+
+    graph.disable_nodes(nodes, mode=True)
+    assert [n.view.disabled for n in nodes] == [True, True]
+    assert [n.model.disabled for n in nodes] == [True, True]
+
+    undo_stack = graph.undo_stack()
+    undo_stack.undo()
+    assert [n.view.disabled for n in nodes] == [False, False]
+    undo_stack.redo()
+    assert [n.model.disabled for n in nodes] == [True, True]
+
+
+def test_unique_name_after_direct_view_rename(graph):
+    node = graph.create_node(FooNode.dtype(), push_undo=False)
+    node.view.name = "Direct"
+
+    assert graph.get_unique_name("Direct") == "Direct 1"
+    assert graph.get_unique_name("  Direct ") == "Direct 1"
+    assert graph.get_node_by_name("Direct") is node
+
+
+def test_delete_connected_nodes_undo(graph):
+    node_a = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_b = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_c = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_a.output(0).connect_to(node_b.input(0))
+    node_b.output(0).connect_to(node_c.input(0))
+    node_c.input(0).set_locked(True, connected_ports=False)
+
+    disconnected = []
+    graph.port_disconnected.connect(lambda *ports: disconnected.append(ports))
+
+    graph.delete_nodes([node_b, node_c])
+    assert node_a.output(0).connected_ports() == []
+    assert len(disconnected) == 2
+    assert graph.get_node_by_id(node_b.id) is None
+
+    graph.undo_stack().undo()
+    assert node_a.output(0).connected_ports() == [node_b.input(0)]
+    assert node_b.output(0).connected_ports() == [node_c.input(0)]
+    assert node_c.input(0).locked()
+
+
+def test_remove_node_without_signal_emits_port_disconnected(graph):
+    node_a = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_b = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_a.output(0).connect_to(node_b.input(0))
+
+    disconnected = []
+    graph.port_disconnected.connect(lambda *ports: disconnected.append(ports))
+
+    graph.remove_node(node_b)
+    assert disconnected == [(node_b.input(0), node_a.output(0))]
+
+
+def test_serialize_after_deserialize_keeps_field_types(graph):
+    graph.create_node(FooNode.dtype(), push_undo=False)
+    session = json.loads(json.dumps(graph.serialize_session()))
+    graph.deserialize_session(session)
+
+    (node,) = graph.all_nodes()
+    assert isinstance(node.model.border_color, tuple)
+    assert isinstance(node.model.text_color, tuple)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        graph.serialize_session()
+
+
+def test_properties_connected_ports_are_lists(graph):
+    node_a = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_b = graph.create_node(FooNode.dtype(), push_undo=False)
+    node_a.output(0).connect_to(node_b.input(0))
+
+    assert node_b.model.properties["inputs"] == {"in": {node_a.id: ["out"]}}
+    assert node_a.model.properties["outputs"] == {"out": {node_b.id: ["in"]}}
+    assert node_a.model.get_property("outputs") == {"out": {node_b.id: ["in"]}}
+
+
+def test_border_color_edits_merge(graph):
+    node = graph.create_node(FooNode.dtype(), push_undo=False)
+    undo_stack = graph.undo_stack()
+    count = undo_stack.count()
+
+    node.set_property("border_color", (10, 10, 10, 255))
+    node.set_property("border_color", (20, 20, 20, 255))
+    assert undo_stack.count() == count + 1
+
+    undo_stack.undo()
+    assert tuple(node.model.border_color) == (74, 84, 85, 255)
+
+
+def test_nodes_moved_without_change_not_pushed(graph):
+    node = graph.create_node(FooNode.dtype(), pos=(10, 20), push_undo=False)
+    undo_stack = graph.undo_stack()
+    count = undo_stack.count()
+
+    graph._on_nodes_moved({node.view: (10.0, 20.0)})
+    assert undo_stack.count() == count
+
+    node.view.xy_pos = [30.0, 40.0]
+    graph._on_nodes_moved({node.view: (10.0, 20.0)})
+    assert undo_stack.count() == count + 1
+    undo_stack.undo()
+    assert list(node.view.xy_pos) == [10.0, 20.0]